@@ -5,8 +5,10 @@ This module contains the FastAPI route definitions and handles HTTP request/resp
 delegating business logic to the service layer.
 """
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from .backlog_evaluator_contracts import (
     EvaluationInput, 
@@ -15,26 +17,136 @@ from .backlog_evaluator_contracts import (
     HealthCheckBody, 
     GeneratorModel, 
     EvaluationResponseBody, 
-    EvaluationMetadata
+    EvaluationMetadata,
+    EvaluationMetricsPayload,
+    EvaluationResult
 )
-from src.service.evaluators import DeepEvalEvaluator
 from src.service.evaluation_service import EvaluationService
+from src.utils.tokens import count_tokens, warm_encoding
 from src.config.config import (
-    logger, PORTKEY_MODEL
+    logger, PORTKEY_MODEL, start_logging, stop_logging
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background services with the application and flush them on shutdown"""
+    start_logging()
+    # Load the tokenizer off the event loop before the first request needs it
+    await warm_encoding()
+    # Initialize evaluation service (one per process, shared by all requests)
+    evaluation_service = EvaluationService()
+    app.state.evaluation_service = evaluation_service
+    # Verify the Portkey connection once per process instead of per request
+    await evaluation_service.test_connection()
+    yield
+    await evaluation_service.aclose()
+    stop_logging()
+
+
 # Create router
-router = APIRouter(prefix="/api/validate", tags=["backlog-evaluator"])
+router = APIRouter(prefix="/api/validate", tags=["backlog-evaluator"], lifespan=lifespan)
+
+
+def get_evaluation_service(request: Request) -> EvaluationService:
+    """Dependency providing the shared evaluation service created by the lifespan"""
+    return request.app.state.evaluation_service
+
+# Response models below are built from server-generated values, so they skip
+# validation via model_construct; only the incoming EvaluationInput is validated
+
+# Provider batch statuses that will never produce output
+_BATCH_FAILED_STATUSES = frozenset({"failed", "expired", "cancelling", "cancelled"})
 
-# Initialize evaluation service
-evaluation_service = EvaluationService()
 
+def _json_response(response: StandardizedEvaluationResponse) -> Response:
+    """Serialize a response model straight to JSON bytes in pydantic-core, skipping the dict round trip"""
+    return Response(content=response.model_dump_json(exclude_none=True), media_type="application/json")
 
-@router.post("/backlog-item-generated", response_model=StandardizedEvaluationResponse)
-async def evaluate_content(evaluation_input: EvaluationInput):
+
+def _completed_response(
+    result: EvaluationResult,
+    backlog_type: str,
+    tokens_used: int,
+    evaluation_time_ms: int,
+    now_iso: str
+) -> StandardizedEvaluationResponse:
+    """Build the standardized response for a finished evaluation"""
+    # Typed evaluation metrics from the result; exclude_none drops unset reasoning on serialization
+    evaluation_metrics = EvaluationMetricsPayload.model_construct(
+        overall_score=result.overall_score,
+        metric_scores=result.metric_scores,
+        summary=result.summary,
+        recommendations=result.recommendations
+    )
+    
+    # Create the response body
+    response_body = EvaluationResponseBody.model_construct(
+        session_id=result.session_id,
+        backlog_type=backlog_type,
+        status="completed",
+        evaluation_metrics=evaluation_metrics,
+        evaluation_metadata=EvaluationMetadata.model_construct(
+            tokens_used=tokens_used,
+            tokens_generated=count_tokens(result.summary),
+            evaluation_time_ms=evaluation_time_ms
+        )
+    )
+    
+    return StandardizedEvaluationResponse.model_construct(
+        status=200,
+        timestamp=now_iso,
+        message="Evaluation completed successfully",
+        body=response_body
+    )
+
+
+def _batch_response(
+    status: int,
+    message: str,
+    session_id: str,
+    backlog_type: str,
+    batch_status: str,
+    batch_id: str,
+    evaluation_time_ms: int,
+    now_iso: str
+) -> StandardizedEvaluationResponse:
+    """Build the standardized response for a batch evaluation that has no result yet"""
+    return StandardizedEvaluationResponse.model_construct(
+        status=status,
+        timestamp=now_iso,
+        message=message,
+        body=EvaluationResponseBody.model_construct(
+            session_id=session_id,
+            backlog_type=backlog_type,
+            status=batch_status,
+            evaluation_metrics={"batch_id": batch_id},
+            evaluation_metadata=EvaluationMetadata.model_construct(
+                tokens_used=0,
+                tokens_generated=0,
+                evaluation_time_ms=evaluation_time_ms
+            )
+        )
+    )
+
+
+@router.post(
+    "/backlog-item-generated",
+    response_model=StandardizedEvaluationResponse,
+    response_model_exclude_none=True,
+    response_class=ORJSONResponse
+)
+async def evaluate_content(
+    evaluation_input: EvaluationInput,
+    service: EvaluationService = Depends(get_evaluation_service)
+):
     """
     Evaluate generated content based on multiple quality metrics.
     
+    With mode "batch" the evaluation is submitted to the provider Batch API and a
+    202 response carrying the batch_id is returned; poll
+    GET /backlog-item-generated/{batch_id} for the result.
+    
     Args:
         evaluation_input: The content and context to evaluate
         
@@ -42,81 +154,160 @@ async def evaluate_content(evaluation_input: EvaluationInput):
         StandardizedEvaluationResponse: Evaluation results in standardized format
     """
     start_time = time.time()
+    now_iso = datetime.fromtimestamp(start_time).isoformat()
     
     try:
-        logger.info(f"Starting evaluation for session: {evaluation_input.session_id}")
+        logger.info("Starting evaluation for session: %s", evaluation_input.session_id)
+        
+        if evaluation_input.mode == "batch":
+            batch_id = await service.submit_batch_evaluation(evaluation_input)
+            if batch_id is not None:
+                return _json_response(_batch_response(
+                    status=202,
+                    message="Evaluation submitted for batch processing",
+                    session_id=evaluation_input.session_id,
+                    backlog_type=evaluation_input.backlog_type,
+                    batch_status="submitted",
+                    batch_id=batch_id,
+                    evaluation_time_ms=int((time.time() - start_time) * 1000),
+                    now_iso=now_iso
+                ))
+            # Cached judge response: answering synchronously is cheaper than a batch round trip
+            logger.info("Cached evaluation for session %s, skipping batch submission", evaluation_input.session_id)
         
         # Delegate to service layer
-        result = await evaluation_service.evaluate_content(evaluation_input)
+        result = await service.evaluate_content(evaluation_input, now_iso)
         
         # Calculate evaluation time
         end_time = time.time()
         evaluation_time_ms = int((end_time - start_time) * 1000)
         
-        # Estimate token usage (these would typically come from the actual LLM API calls)
-        estimated_tokens_used = len(evaluation_input.user_prompt.split()) * 2  # Rough estimation
-        estimated_tokens_generated = len(result.summary.split()) * 2  # Rough estimation
-        
-        # Create evaluation metrics dictionary from the metric scores
-        evaluation_metrics = {
-            "overall_score": result.overall_score,
-            "metric_scores": [score.model_dump() for score in result.metric_scores],
-            "summary": result.summary,
-            "recommendations": result.recommendations
-        }
+        logger.info("Evaluation completed for session: %s, Overall score: %.3f", evaluation_input.session_id, result.overall_score)
         
-        # Create the response body
-        response_body = EvaluationResponseBody(
-            session_id=evaluation_input.session_id,
+        # Token usage for the prompt (actual LLM usage is not reported back)
+        return _json_response(_completed_response(
+            result,
             backlog_type=evaluation_input.backlog_type,
-            status="completed",
-            evaluation_metrics=evaluation_metrics,
-            evaluation_metadata=EvaluationMetadata(
-                tokens_used=estimated_tokens_used,
-                tokens_generated=estimated_tokens_generated,
-                evaluation_time_ms=evaluation_time_ms
-            )
-        )
-        
-        logger.info(f"Evaluation completed for session: {evaluation_input.session_id}, Overall score: {result.overall_score:.3f}")
-        
-        return StandardizedEvaluationResponse(
-            status=200,
-            timestamp=datetime.now().isoformat(),
-            message="Evaluation completed successfully",
-            body=response_body
-        )
+            tokens_used=count_tokens(evaluation_input.user_prompt),
+            evaluation_time_ms=evaluation_time_ms,
+            now_iso=now_iso
+        ))
         
     except Exception as e:
         # Calculate evaluation time even on failure
         end_time = time.time()
         evaluation_time_ms = int((end_time - start_time) * 1000)
         
-        logger.error(f"Evaluation failed for session {evaluation_input.session_id}: {str(e)}")
+        logger.error("Evaluation failed for session %s: %s", evaluation_input.session_id, e)
         
         # Create error response body
-        error_response_body = EvaluationResponseBody(
+        error_response_body = EvaluationResponseBody.model_construct(
             session_id=evaluation_input.session_id,
             backlog_type=evaluation_input.backlog_type,
             status="failed",
             evaluation_metrics={"error": str(e)},
-            evaluation_metadata=EvaluationMetadata(
+            evaluation_metadata=EvaluationMetadata.model_construct(
                 tokens_used=0,
                 tokens_generated=0,
                 evaluation_time_ms=evaluation_time_ms
             )
         )
         
-        return StandardizedEvaluationResponse(
+        return _json_response(StandardizedEvaluationResponse.model_construct(
             status=500,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
             message=f"Evaluation failed: {str(e)}",
             body=error_response_body
-        )
+        ))
+
+
+@router.get(
+    "/backlog-item-generated/{batch_id}",
+    response_model=StandardizedEvaluationResponse,
+    response_model_exclude_none=True,
+    response_class=ORJSONResponse
+)
+async def get_batch_evaluation(
+    batch_id: str,
+    service: EvaluationService = Depends(get_evaluation_service)
+):
+    """
+    Poll an evaluation submitted with mode "batch".
+    
+    Args:
+        batch_id: The batch_id returned when the evaluation was submitted
+    
+    Returns:
+        StandardizedEvaluationResponse: 202 while the batch is running, the evaluation
+        results once it has completed, or 500 if the batch failed or expired
+    """
+    start_time = time.time()
+    now_iso = datetime.fromtimestamp(start_time).isoformat()
+    session_id = ""
+    backlog_type = ""
+    
+    try:
+        batch_status, metadata, result = await service.collect_batch_evaluation(batch_id, now_iso)
+        session_id = metadata.get("session_id", "")
+        backlog_type = metadata.get("backlog_type", "")
+        evaluation_time_ms = int((time.time() - start_time) * 1000)
+        
+        if result is not None:
+            logger.info("Batch evaluation %s completed for session: %s, Overall score: %.3f", batch_id, session_id, result.overall_score)
+            return _json_response(_completed_response(
+                result,
+                backlog_type=backlog_type,
+                tokens_used=int(metadata.get("tokens_used", 0)),
+                evaluation_time_ms=evaluation_time_ms,
+                now_iso=now_iso
+            ))
+        
+        if batch_status in _BATCH_FAILED_STATUSES:
+            logger.error("Batch evaluation %s for session %s ended with status: %s", batch_id, session_id, batch_status)
+            return _json_response(_batch_response(
+                status=500,
+                message=f"Batch evaluation {batch_status}",
+                session_id=session_id,
+                backlog_type=backlog_type,
+                batch_status="failed",
+                batch_id=batch_id,
+                evaluation_time_ms=evaluation_time_ms,
+                now_iso=now_iso
+            ))
+        
+        return _json_response(_batch_response(
+            status=202,
+            message=f"Batch evaluation {batch_status}",
+            session_id=session_id,
+            backlog_type=backlog_type,
+            batch_status="in_progress",
+            batch_id=batch_id,
+            evaluation_time_ms=evaluation_time_ms,
+            now_iso=now_iso
+        ))
+    
+    except Exception as e:
+        logger.error("Failed to retrieve batch evaluation %s: %s", batch_id, e)
+        return _json_response(StandardizedEvaluationResponse.model_construct(
+            status=500,
+            timestamp=now_iso,
+            message=f"Batch evaluation retrieval failed: {str(e)}",
+            body=EvaluationResponseBody.model_construct(
+                session_id=session_id,
+                backlog_type=backlog_type,
+                status="failed",
+                evaluation_metrics={"batch_id": batch_id, "error": str(e)},
+                evaluation_metadata=EvaluationMetadata.model_construct(
+                    tokens_used=0,
+                    tokens_generated=0,
+                    evaluation_time_ms=int((time.time() - start_time) * 1000)
+                )
+            )
+        ))
 
 
-@router.get("/health", response_model=HealthCheckResponse)
-async def validate_health():
+@router.get("/health", response_model=HealthCheckResponse, response_class=ORJSONResponse)
+async def validate_health(service: EvaluationService = Depends(get_evaluation_service)):
     """
     Backlog Core compatible health check endpoint.
     
@@ -126,17 +317,19 @@ async def validate_health():
     Returns:
         HealthCheckResponse: Structured health check response with status, timestamp, message, and body
     """
+    now_iso = datetime.now().isoformat()
+    
     try:
         # Delegate to service layer
-        health_status = await evaluation_service.check_health()
+        health_status = service.check_health()
         
-        return HealthCheckResponse(
+        return HealthCheckResponse.model_construct(
             status=200 if health_status["is_healthy"] else 503,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
             message="Health check passed successfully" if health_status["is_healthy"] else "Service is unhealthy",
-            body=HealthCheckBody(
+            body=HealthCheckBody.model_construct(
                 status="healthy" if health_status["is_healthy"] else "unhealthy",
-                generator_model=GeneratorModel(
+                generator_model=GeneratorModel.model_construct(
                     name=PORTKEY_MODEL,
                     status="loaded" if health_status["is_healthy"] else "error"
                 )
@@ -144,14 +337,14 @@ async def validate_health():
         )
         
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
-        return HealthCheckResponse(
+        logger.error("Health check failed: %s", e)
+        return HealthCheckResponse.model_construct(
             status=500,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
             message=f"Health check failed: {str(e)}",
-            body=HealthCheckBody(
+            body=HealthCheckBody.model_construct(
                 status="error",
-                generator_model=GeneratorModel(
+                generator_model=GeneratorModel.model_construct(
                     name=PORTKEY_MODEL,
                     status="error"
                 )
@@ -159,8 +352,8 @@ async def validate_health():
         )
 
 
-@router.get("/metrics/info")
-async def get_metrics_info():
+@router.get("/metrics/info", response_class=ORJSONResponse)
+async def get_metrics_info(service: EvaluationService = Depends(get_evaluation_service)):
     """
     Get information about available evaluation metrics and their weights.
     
@@ -168,4 +361,4 @@ async def get_metrics_info():
         dict: Metrics information including descriptions and weights
     """
     # Delegate to service layer
-    return await evaluation_service.get_metrics_info()
+    return service.get_metrics_info()
@@ -1,19 +1,23 @@
 """
 Pydantic models for the Response Evaluator Agent API.
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal, Union
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class GeneratedContent(BaseModel):
     """Generated content structure"""
+    model_config = ConfigDict(frozen=True)
+    
     title: str
     formatted_output: str
 
 
 class ContextItem(BaseModel):
     """Context item structure"""
+    model_config = ConfigDict(frozen=True)
+    
     content: str
 
 
@@ -26,6 +30,9 @@ class EvaluationInput(BaseModel):
     generated_content: GeneratedContent
     context: List[ContextItem]
     template: str = Field(..., description="Template with format instructions that the generated content should follow")
+    mode: Literal["sync", "batch"] = Field(
+        "sync", description="'batch' submits the evaluation to the provider Batch API and returns a batch_id to poll"
+    )
 
 
 class EvaluationMetric(str, Enum):
@@ -42,25 +49,13 @@ class EvaluationMetric(str, Enum):
 
 
 class MetricScore(BaseModel):
-    """Score for a specific metric"""
+    """Score for a specific metric (serialize with exclude_none=True to omit unset reasoning)"""
+    model_config = ConfigDict(frozen=True)
+    
     metric: str
     score: float = Field(..., ge=0.0, le=1.0, description="Score between 0 and 1")
     reasoning: Optional[str] = None
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence in the score")
-    
-    def model_dump(self, **kwargs):
-        """Custom serialization to exclude reasoning field when None"""
-        data = super().model_dump(**kwargs)
-        if data.get('reasoning') is None:
-            data.pop('reasoning', None)
-        return data
-    
-    def dict(self, **kwargs):
-        """For backward compatibility with older Pydantic versions"""
-        data = super().dict(**kwargs)
-        if data.get('reasoning') is None:
-            data.pop('reasoning', None)
-        return data
 
 
 class EvaluationResult(BaseModel):
@@ -81,12 +76,23 @@ class EvaluationMetadata(BaseModel):
     evaluation_time_ms: int = Field(..., description="Duration of evaluation in milliseconds")
 
 
+class EvaluationMetricsPayload(BaseModel):
+    """Evaluation metrics of a completed evaluation"""
+    overall_score: float
+    metric_scores: List[MetricScore]
+    summary: str
+    recommendations: str
+
+
 class EvaluationResponseBody(BaseModel):
     """Evaluation response body following the new specification"""
     session_id: str
     backlog_type: str
     status: str = Field(..., description="Status of generation")
-    evaluation_metrics: Dict[str, Any] = Field(default_factory=dict, description="Evaluation metrics data")
+    # Typed for completed evaluations; batch and error responses carry batch_id/error entries
+    evaluation_metrics: Union[EvaluationMetricsPayload, Dict[str, Any]] = Field(
+        default_factory=dict, description="Evaluation metrics data"
+    )
     evaluation_metadata: EvaluationMetadata
 
 
@@ -100,6 +106,8 @@ class StandardizedEvaluationResponse(BaseModel):
 
 class GeneratorModel(BaseModel):
     """Generator model information"""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     status: str = "loaded"
 
@@ -2,15 +2,31 @@
 Configuration settings and constants for the Response Evaluator Agent API.
 """
 import os
+import queue
 import logging
-from typing import Dict, Any
-from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import List, Mapping, Optional
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-@dataclass
+# Default evaluation metric weights (read-only, shared by every EvaluationConfig)
+DEFAULT_METRIC_WEIGHTS: Mapping[str, float] = MappingProxyType({
+    "relevance": 0.18,
+    "accuracy": 0.15,
+    "completeness": 0.15,
+    "clarity": 0.12,
+    "structure": 0.08,
+    "consistency": 0.08,
+    "hallucination_detection": 0.12,
+    "context_adherence": 0.08,
+    "factual_grounding": 0.04
+})
+
+@dataclass(slots=True, frozen=True)
 class ApiConfig:
     """API server configuration"""
     title: str = "Response Evaluator Agent"
@@ -18,33 +34,46 @@ class ApiConfig:
     version: str = "1.0.0"
     host: str = os.getenv("API_HOST", "0.0.0.0")
     port: int = int(os.getenv("API_PORT", "8040"))
-    reload: bool = os.getenv("API_RELOAD", "true").lower() == "true"
+    reload: bool = os.getenv("API_RELOAD", "false").lower() == "true"
     log_level: str = os.getenv("LOG_LEVEL", "info")
+    workers: int = int(os.getenv("API_WORKERS", "4"))
+    loop: str = os.getenv("API_LOOP", "uvloop")
+    http: str = os.getenv("API_HTTP", "httptools")
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryConfig:
     """Configuration for retry operations"""
     max_retries: int = int(os.getenv("MAX_RETRIES", "3"))
     retry_delay: float = float(os.getenv("RETRY_DELAY", "1.0"))
     exponential_backoff: bool = os.getenv("EXPONENTIAL_BACKOFF", "true").lower() == "true"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProviderConfig:
     """LLM Provider configuration"""
     endpoint: str = os.getenv("PORTKEY_BASE_URL", "https://portkeygateway.perficient.com/v1")
     api_key: str = os.getenv("PORTKEY_API_KEY", "")
     llm_model: str = os.getenv("PORTKEY_MODEL", "gpt-4o-mini")
     llm_model_provider: str = os.getenv("PORTKEY_PROVIDER", "@azure-openai")
+    rpm_limit: int = int(os.getenv("RPM_LIMIT", "0"))
+    tpm_limit: int = int(os.getenv("TPM_LIMIT", "0"))
+    http_pool_size: int = int(os.getenv("HTTP_POOL_SIZE", "100"))
+    http_timeout: float = float(os.getenv("HTTP_TIMEOUT", "120.0"))
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BehaviourConfig:
     """Application behavior configuration"""
     default_temperature: float = float(os.getenv("DEFAULT_TEMPERATURE", "0.6"))
     max_tokens_generation: int = int(os.getenv("MAX_TOKENS_GENERATION", "2000"))
     max_tokens_summary: int = int(os.getenv("MAX_TOKENS_SUMMARY", "200"))
     max_tokens_recommendations: int = int(os.getenv("MAX_TOKENS_RECOMMENDATIONS", "300"))
+    # Batched calls are still sent as separate concurrent requests, so batching only adds
+    # up to FLUSH_INTERVAL_MS of latency unless the provider coalesces them; off by default
+    batch_size: int = int(os.getenv("BATCH_SIZE", "1"))
+    flush_interval_ms: int = int(os.getenv("FLUSH_INTERVAL_MS", "50"))
+    stream_judge: bool = os.getenv("STREAM_JUDGE", "false").lower() == "true"
+    metric_fallback: bool = os.getenv("METRIC_FALLBACK", "false").lower() == "true"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EvaluationConfig:
     """Evaluation-specific configuration"""
     deepeval_threshold: float = float(os.getenv("DEEPEVAL_THRESHOLD", "0.7"))
@@ -53,24 +82,26 @@ class EvaluationConfig:
     factual_confidence_threshold: float = float(os.getenv("FACTUAL_CONFIDENCE_THRESHOLD", "0.6"))
     
     # Evaluation metric weights
-    metric_weights: Dict[str, float] = None
+    metric_weights: Mapping[str, float] = field(default_factory=lambda: DEFAULT_METRIC_WEIGHTS)
     
-    def __post_init__(self):
-        """Initialize metric weights after dataclass creation"""
-        if self.metric_weights is None:
-            self.metric_weights = {
-                "relevance": 0.18,
-                "accuracy": 0.15,
-                "completeness": 0.15,
-                "clarity": 0.12,
-                "structure": 0.08,
-                "consistency": 0.08,
-                "hallucination_detection": 0.12,
-                "context_adherence": 0.08,
-                "factual_grounding": 0.04
-            }
-
-@dataclass
+@dataclass(slots=True, frozen=True)
+class CacheConfig:
+    """LLM response cache configuration"""
+    enabled: bool = os.getenv("CACHE_ENABLED", "false").lower() == "true"
+    policy: str = os.getenv("CACHE_POLICY", "enabled")
+    ttl: int = int(os.getenv("CACHE_TTL", "86400"))
+    backend: str = os.getenv("CACHE_BACKEND", "memory")
+    path: str = os.getenv("CACHE_PATH", ".llm_cache")
+    redis_url: str = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+    semantic_enabled: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    semantic_model: str = os.getenv("SEMANTIC_CACHE_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+    semantic_threshold: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+    semantic_max_entries: int = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "1000"))
+    response_enabled: bool = os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+    response_maxsize: int = int(os.getenv("RESPONSE_CACHE_MAXSIZE", "1024"))
+    response_ttl: int = int(os.getenv("RESPONSE_CACHE_TTL", "3600"))
+
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     """Logging configuration"""
     level: str = os.getenv("LOG_LEVEL", "INFO")
@@ -78,6 +109,11 @@ class LoggingConfig:
     file_name: str = os.getenv("LOG_FILE", "evaluation_results.log")
     console_logging: bool = os.getenv("CONSOLE_LOGGING", "true").lower() == "true"
 
+# File/console handlers shared by every Config; attached to the root logger directly
+# until start_logging() moves them behind the background listener
+_log_handlers: List[logging.Handler] = []
+_log_listener: Optional[QueueListener] = None
+
 class Config:
     """Main configuration class"""
     def __init__(self):
@@ -86,13 +122,24 @@ class Config:
         self.retry = RetryConfig()
         self.behaviour = BehaviourConfig()
         self.evaluation = EvaluationConfig()
+        self.cache = CacheConfig()
         self.logging = LoggingConfig()
         
         # Setup logging with the current configuration
         self.logger = self._setup_logging()
     
     def _setup_logging(self) -> logging.Logger:
-        """Configure logging for the application"""
+        """
+        Configure logging for the application.
+        
+        The file and console handlers are attached to the root logger and installed
+        only once per process. start_logging() later routes them through a queue.
+        """
+        global _log_handlers
+        if _log_handlers:
+            return logging.getLogger(__name__)
+        
+        formatter = logging.Formatter(self.logging.format)
         handlers = []
         
         # Add file handler
@@ -102,18 +149,54 @@ class Config:
         if self.logging.console_logging:
             handlers.append(logging.StreamHandler())
         
-        logging.basicConfig(
-            level=getattr(logging, self.logging.level.upper()),
-            format=self.logging.format,
-            handlers=handlers,
-            force=True  # Override any existing logging configuration
-        )
+        for handler in handlers:
+            handler.setFormatter(formatter)
         
+        # Override any existing logging configuration
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+            handler.close()
+        for handler in handlers:
+            root_logger.addHandler(handler)
+        root_logger.setLevel(getattr(logging, self.logging.level.upper()))
+        
+        _log_handlers = handlers
         return logging.getLogger(__name__)
 
 # Global configuration instance
 config = Config()
 
+def start_logging() -> None:
+    """
+    Route log records through a QueueHandler so request handlers never block on disk
+    writes; a QueueListener thread writes them to the file and console handlers.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue = queue.Queue(-1)
+    _log_listener = QueueListener(log_queue, *_log_handlers, respect_handler_level=True)
+    _log_listener.start()
+    root_logger = logging.getLogger()
+    root_logger.addHandler(QueueHandler(log_queue))
+    for handler in _log_handlers:
+        root_logger.removeHandler(handler)
+
+def stop_logging() -> None:
+    """Flush queued log records, stop the listener and attach the handlers directly again"""
+    global _log_listener
+    if _log_listener is None:
+        return
+    root_logger = logging.getLogger()
+    for handler in _log_handlers:
+        root_logger.addHandler(handler)
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, QueueHandler):
+            root_logger.removeHandler(handler)
+    _log_listener.stop()
+    _log_listener = None
+
 # Backward compatibility - Export commonly used values
 API_TITLE = config.api.title
 API_DESCRIPTION = config.api.description
@@ -122,16 +205,25 @@ HOST = config.api.host
 PORT = config.api.port
 RELOAD = config.api.reload
 LOG_LEVEL = config.api.log_level
+WORKERS = config.api.workers
 
 PORTKEY_API_KEY = config.provider.api_key
 PORTKEY_BASE_URL = config.provider.endpoint
 PORTKEY_PROVIDER = config.provider.llm_model_provider
 PORTKEY_MODEL = config.provider.llm_model
+RPM_LIMIT = config.provider.rpm_limit
+TPM_LIMIT = config.provider.tpm_limit
+HTTP_POOL_SIZE = config.provider.http_pool_size
+HTTP_TIMEOUT = config.provider.http_timeout
 
 DEFAULT_TEMPERATURE = config.behaviour.default_temperature
 MAX_TOKENS_GENERATION = config.behaviour.max_tokens_generation
 MAX_TOKENS_SUMMARY = config.behaviour.max_tokens_summary
 MAX_TOKENS_RECOMMENDATIONS = config.behaviour.max_tokens_recommendations
+BATCH_SIZE = config.behaviour.batch_size
+FLUSH_INTERVAL_MS = config.behaviour.flush_interval_ms
+STREAM_JUDGE = config.behaviour.stream_judge
+METRIC_FALLBACK = config.behaviour.metric_fallback
 
 MAX_RETRIES = config.retry.max_retries
 RETRY_DELAY = config.retry.retry_delay
@@ -142,4 +234,18 @@ HALLUCINATION_THRESHOLD = config.evaluation.hallucination_threshold
 CONTEXT_SIMILARITY_THRESHOLD = config.evaluation.context_similarity_threshold
 FACTUAL_CONFIDENCE_THRESHOLD = config.evaluation.factual_confidence_threshold
 
+CACHE_ENABLED = config.cache.enabled
+CACHE_POLICY = config.cache.policy
+CACHE_TTL = config.cache.ttl
+CACHE_BACKEND = config.cache.backend
+CACHE_PATH = config.cache.path
+CACHE_REDIS_URL = config.cache.redis_url
+SEMANTIC_CACHE_ENABLED = config.cache.semantic_enabled
+SEMANTIC_CACHE_MODEL = config.cache.semantic_model
+SEMANTIC_CACHE_THRESHOLD = config.cache.semantic_threshold
+SEMANTIC_CACHE_MAX_ENTRIES = config.cache.semantic_max_entries
+RESPONSE_CACHE_ENABLED = config.cache.response_enabled
+RESPONSE_CACHE_MAXSIZE = config.cache.response_maxsize
+RESPONSE_CACHE_TTL = config.cache.response_ttl
+
 logger = config.logger
@@ -1,18 +1,31 @@
+import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
-import os
+from prometheus_client import CollectorRegistry, make_asgi_app, multiprocess
 from src.api.backlog_evaluator_api import router as evaluator_router
+from src.config.config import config
 
 app = FastAPI(
     title="SDLC Accelerator AI Core",
     description="AI-powered core service for software development lifecycle acceleration",
-    version="1.0.0",
+    version=config.api.version,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 app.include_router(evaluator_router)
 
+# Prometheus scrape endpoint (retry attempt histogram, etc.). With several workers,
+# set PROMETHEUS_MULTIPROC_DIR so a scrape aggregates every worker's samples
+if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+    metrics_registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(metrics_registry)
+    app.mount("/metrics", make_asgi_app(registry=metrics_registry))
+else:
+    app.mount("/metrics", make_asgi_app())
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -25,8 +38,13 @@ app.add_middleware(
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
-        host=os.getenv("API_HOST", "0.0.0.0"),
-        port=int(os.getenv("API_PORT", 8040)),
-        reload=os.getenv("API_RELOAD", "true").lower() == "true",
-        log_level=os.getenv("LOG_LEVEL", "debug")
+        host=config.api.host,
+        port=config.api.port,
+        reload=config.api.reload,
+        log_level=config.api.log_level,
+        # Each worker process builds its own Portkey client and in-memory caches;
+        # use CACHE_BACKEND=redis to share cached responses between workers
+        workers=config.api.workers,
+        loop=config.api.loop,
+        http=config.api.http
     )
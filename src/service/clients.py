@@ -2,50 +2,588 @@
 API clients for external services used by the Response Evaluator Agent.
 """
 import asyncio
-from typing import List, Dict, Optional
-from portkey_ai import Portkey
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, List, Dict, Optional, Protocol, Tuple, Union
+import httpx
+import numpy as np
+from portkey_ai import AsyncPortkey
+from prometheus_client import Histogram
 
 from src.config.config import (
     PORTKEY_API_KEY,
     PORTKEY_BASE_URL,
     PORTKEY_PROVIDER,
     PORTKEY_MODEL,
+    RPM_LIMIT,
+    TPM_LIMIT,
+    HTTP_POOL_SIZE,
+    HTTP_TIMEOUT,
     DEFAULT_TEMPERATURE,
     MAX_TOKENS_GENERATION,
     MAX_TOKENS_SUMMARY,
     MAX_TOKENS_RECOMMENDATIONS,
+    BATCH_SIZE,
+    FLUSH_INTERVAL_MS,
     MAX_RETRIES,
     RETRY_DELAY,
+    CACHE_ENABLED,
+    CACHE_POLICY,
+    CACHE_TTL,
+    CACHE_BACKEND,
+    CACHE_PATH,
+    CACHE_REDIS_URL,
+    SEMANTIC_CACHE_ENABLED,
+    SEMANTIC_CACHE_MODEL,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_MAX_ENTRIES,
     logger
 )
+from src.utils.tokens import count_tokens
 from .prompts import SYSTEM_PROMPTS
 
 
+# System messages are fixed per call type; only the user message varies per call
+_EVALUATION_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPTS["evaluation"]}
+_SUMMARY_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPTS["summary"]}
+_RECOMMENDATIONS_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPTS["recommendations"]}
+
+# Provider errors that fail the same way on every attempt (bad request, auth, unknown model)
+_NON_RETRYABLE_STATUS_CODES = frozenset({400, 401, 403, 404, 422})
+
+# Seconds the startup connection probe may take before the provider is reported unreachable
+_CONNECTION_TEST_TIMEOUT = 10.0
+
+_CALL_ATTEMPTS = Histogram(
+    "portkey_call_attempts",
+    "Attempts per Portkey chat completion, including the last one",
+    ["context", "outcome"],
+    buckets=tuple(range(1, MAX_RETRIES + 2))
+)
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached LLM responses"""
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        ...
+    
+    async def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process cache backend (per worker)"""
+    
+    def __init__(self):
+        self._store: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at and time.time() > expires_at:
+            self._store.pop(key, None)
+            return None
+        return value
+    
+    async def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        self._store[key] = (time.time() + ttl if ttl > 0 else 0.0, value)
+
+
+class FileCacheBackend:
+    """File cache backend storing one JSON document per key under <path>/<2char>/<hash>.json"""
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+    
+    def _file_for(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json"
+    
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        file_path = self._file_for(key)
+        if not file_path.exists():
+            return None
+        entry = json.loads(file_path.read_text(encoding="utf-8"))
+        if entry["expires_at"] and time.time() > entry["expires_at"]:
+            file_path.unlink(missing_ok=True)
+            return None
+        return entry["value"]
+    
+    def _write(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        file_path = self._file_for(key)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"expires_at": time.time() + ttl if ttl > 0 else 0.0, "value": value}
+        # Write to a temporary file first so concurrent readers never see partial JSON
+        tmp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+        tmp_path.replace(file_path)
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._read, key)
+    
+    async def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        await asyncio.to_thread(self._write, key, value, ttl)
+
+
+class RedisCacheBackend:
+    """Redis cache backend, shared across workers and replicas"""
+    
+    def __init__(self, url: str, prefix: str = "llm-cache:"):
+        from redis.asyncio import Redis
+        
+        self._redis = Redis.from_url(url)
+        self._prefix = prefix
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self._redis.get(self._prefix + key)
+        return json.loads(raw) if raw is not None else None
+    
+    async def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        await self._redis.set(self._prefix + key, json.dumps(value), ex=ttl if ttl > 0 else None)
+
+
+class LLMCache:
+    """
+    Deterministic response cache for LLM calls.
+    
+    Policies:
+        enabled: read and write, only for deterministic calls (temperature == 0)
+        enabled_all: read and write regardless of temperature
+        read_only: read existing entries for deterministic calls, never write
+        replay: serve only from the cache, a miss raises instead of calling the provider
+        disabled: bypass the cache entirely
+    """
+    
+    POLICIES = ("enabled", "enabled_all", "read_only", "replay", "disabled")
+    
+    def __init__(self, backend: CacheBackend, policy: str = "enabled", ttl: int = 0):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown cache policy '{policy}', expected one of {self.POLICIES}")
+        self.backend = backend
+        self.policy = policy
+        self.ttl = ttl
+        self.stats = {"hits": 0, "misses": 0}
+    
+    @staticmethod
+    def make_key(
+        model: str,
+        provider: str,
+        temperature: float,
+        max_tokens: int,
+        messages: List[Dict[str, str]]
+    ) -> str:
+        """Compute the SHA-256 cache key for a chat completion request"""
+        payload = json.dumps(
+            {
+                "model": model,
+                "provider": provider,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "messages": messages
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def applies_to(self, temperature: float) -> bool:
+        """Whether a call with the given temperature should go through the cache"""
+        if self.policy == "disabled":
+            return False
+        if self.policy in ("enabled_all", "replay"):
+            return True
+        return temperature == 0
+    
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached content for a key, or None on a miss"""
+        try:
+            entry = await self.backend.get(key)
+        except Exception as e:
+            logger.warning("LLM cache read failed: %s", e)
+            entry = None
+        
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        
+        self.stats["hits"] += 1
+        return entry["content"]
+    
+    async def set(self, key: str, content: str) -> None:
+        """Store content for a key when the policy allows writes"""
+        if self.policy not in ("enabled", "enabled_all"):
+            return
+        try:
+            await self.backend.set(key, {"content": content}, self.ttl)
+        except Exception as e:
+            logger.warning("LLM cache write failed: %s", e)
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache tier consulted after an exact-match miss.
+    
+    Entries are partitioned by everything except the final user message (model,
+    sampling parameters and the preceding messages) plus a caller-supplied scope that
+    must match exactly, e.g. the generated content being judged. A near-duplicate user
+    prompt therefore only reuses a response produced for the same system prompt and the
+    same scope; calls without a scope skip this tier. Embeddings are normalized, making
+    the dot product the cosine similarity.
+    """
+    
+    def __init__(self, model_name: str, threshold: float, max_entries: int):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0}
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._entries: Dict[str, Tuple[np.ndarray, List[str]]] = {}
+    
+    def _embed(self, text: str) -> np.ndarray:
+        with self._model_lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+                
+                self._model = SentenceTransformer(self.model_name)
+                logger.info("Semantic cache embedding model loaded: %s", self.model_name)
+        return self._model.encode(text, normalize_embeddings=True).astype(np.float32)
+    
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed text off the event loop"""
+        return await asyncio.to_thread(self._embed, text)
+    
+    def get(self, partition: str, embedding: np.ndarray) -> Optional[str]:
+        """Return the most similar cached response above the threshold, if any"""
+        entry = self._entries.get(partition)
+        if entry is not None:
+            vectors, responses = entry
+            similarities = vectors @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                self.stats["hits"] += 1
+                return responses[best]
+        
+        self.stats["misses"] += 1
+        return None
+    
+    def set(self, partition: str, embedding: np.ndarray, content: str) -> None:
+        """Add a response, evicting the oldest entries of the partition beyond max_entries"""
+        vectors, responses = self._entries.get(partition, (np.empty((0, embedding.shape[0]), np.float32), []))
+        vectors = np.vstack([vectors, embedding])[-self.max_entries:]
+        responses = (responses + [content])[-self.max_entries:]
+        self._entries[partition] = (vectors, responses)
+
+
+def _build_llm_cache() -> LLMCache:
+    """Create the LLM cache from configuration"""
+    if not CACHE_ENABLED:
+        return LLMCache(MemoryCacheBackend(), policy="disabled")
+    
+    if CACHE_BACKEND == "file":
+        backend = FileCacheBackend(CACHE_PATH)
+    elif CACHE_BACKEND == "redis":
+        backend = RedisCacheBackend(CACHE_REDIS_URL)
+    else:
+        backend = MemoryCacheBackend()
+    
+    logger.info("LLM cache enabled with %s backend and '%s' policy", CACHE_BACKEND, CACHE_POLICY)
+    return LLMCache(backend, policy=CACHE_POLICY, ttl=CACHE_TTL)
+
+
+class TokenBucket:
+    """
+    Client-side rate limiter honouring the provider's requests-per-minute and
+    tokens-per-minute quotas.
+    
+    Both budgets refill continuously; acquire() waits until one request and the
+    estimated tokens are available. Rates back off multiplicatively when the provider
+    still returns 429 and recover additively on success (AIMD). A limit of 0 disables
+    that budget.
+    """
+    
+    def __init__(self, rpm: int, tpm: int):
+        self.max_rpm = float(rpm)
+        self.max_tpm = float(tpm)
+        self.rpm = self.max_rpm
+        self.tpm = self.max_tpm
+        self.request_tokens = self.rpm
+        self.token_tokens = self.tpm
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        return self.max_rpm > 0 or self.max_tpm > 0
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.rpm > 0:
+            self.request_tokens = min(self.rpm, self.request_tokens + elapsed * self.rpm / 60)
+        if self.tpm > 0:
+            self.token_tokens = min(self.tpm, self.token_tokens + elapsed * self.tpm / 60)
+    
+    def _wait_time(self, needed_tokens: float) -> float:
+        wait = 0.0
+        if self.rpm > 0 and self.request_tokens < 1:
+            wait = max(wait, (1 - self.request_tokens) * 60 / self.rpm)
+        if self.tpm > 0 and self.token_tokens < needed_tokens:
+            wait = max(wait, (needed_tokens - self.token_tokens) * 60 / self.tpm)
+        return wait
+    
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Wait until the request fits in both budgets, then consume it"""
+        if not self.enabled:
+            return
+        
+        async with self._lock:
+            # A single request larger than the whole budget only waits for a full bucket
+            needed_tokens = min(float(estimated_tokens), self.tpm) if self.tpm > 0 else 0.0
+            while True:
+                self._refill()
+                wait = self._wait_time(needed_tokens)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            
+            if self.rpm > 0:
+                self.request_tokens -= 1
+            if self.tpm > 0:
+                self.token_tokens -= needed_tokens
+    
+    def on_success(self) -> None:
+        """Additive increase back towards the configured limits"""
+        if self.max_rpm > 0:
+            self.rpm = min(self.max_rpm, self.rpm + self.max_rpm * 0.05)
+        if self.max_tpm > 0:
+            self.tpm = min(self.max_tpm, self.tpm + self.max_tpm * 0.05)
+    
+    def on_rate_limited(self) -> None:
+        """Multiplicative decrease after a 429, draining the request budget"""
+        if self.max_rpm > 0:
+            self.rpm = max(1.0, self.rpm / 2)
+            self.request_tokens = min(self.request_tokens, 0.0)
+        if self.max_tpm > 0:
+            self.tpm = max(1.0, self.tpm / 2)
+            self.token_tokens = min(self.token_tokens, self.tpm)
+
+
+class JSONObjectScanner:
+    """
+    Finds the first complete top-level JSON object in streamed text.
+    
+    Each chunk is scanned once as it arrives, tracking brace depth and skipping
+    braces inside string literals, so the buffer is never rescanned as it grows.
+    """
+    
+    def __init__(self):
+        self._parts: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._start: Tuple[int, int] = (0, 0)
+    
+    @property
+    def text(self) -> str:
+        """Everything fed so far"""
+        return "".join(self._parts)
+    
+    def feed(self, chunk: str) -> Optional[str]:
+        """Add a chunk; return the object's text once its closing brace arrives"""
+        self._parts.append(chunk)
+        for offset, char in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == "{":
+                if self._depth == 0:
+                    self._start = (len(self._parts) - 1, offset)
+                self._depth += 1
+            elif self._depth == 0:
+                # Text before the object (e.g. a preamble) is not JSON
+                continue
+            elif char == '"':
+                self._in_string = True
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    first_part, start = self._start
+                    if first_part == len(self._parts) - 1:
+                        return chunk[start:offset + 1]
+                    return "".join([self._parts[first_part][start:], *self._parts[first_part + 1:-1], chunk[:offset + 1]])
+        return None
+
+
+class AdaptiveBatcher:
+    """
+    Coalesces concurrent completion requests into batches.
+    
+    Submitted requests are queued and flushed through PortkeyAPIClient.call_batch once
+    max_batch_size requests are waiting or max_latency_ms has passed since the first
+    request of the batch arrived.
+    """
+    
+    def __init__(self, client: "PortkeyAPIClient", max_batch_size: int, max_latency_ms: int, context: str):
+        self.client = client
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_latency = max(0, max_latency_ms) / 1000
+        self.context = context
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._flushes: set = set()
+    
+    async def submit(self, messages: List[Dict[str, str]], cache_scope: Optional[str] = None) -> str:
+        """Queue a completion request and wait for its result"""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((messages, cache_scope, future))
+        return await future
+    
+    async def _run(self) -> None:
+        """Collect queued requests into batches and dispatch them"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_latency
+            
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Dispatch without waiting so the next window starts collecting immediately
+            flush = asyncio.create_task(self._flush(batch))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+    
+    async def _flush(self, batch: List[Tuple[List[Dict[str, str]], Optional[str], asyncio.Future]]) -> None:
+        """Send a batch and resolve the waiting futures"""
+        if len(batch) > 1:
+            logger.info("Dispatching batch of %s requests for context: %s", len(batch), self.context)
+        
+        try:
+            results = await self.client.call_batch(
+                [messages for messages, _, _ in batch],
+                context=self.context,
+                cache_scopes=[cache_scope for _, cache_scope, _ in batch]
+            )
+        except Exception as e:
+            results = [e] * len(batch)
+        
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+    
+    async def close(self) -> None:
+        """Stop the batching worker and wait for in-flight batches"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+
 class PortkeyAPIClient:
     """Centralized Portkey API client with error handling and retry logic"""
     
     def __init__(self):
         try:
-            self.portkey = Portkey(
+            # One long-lived connection pool so calls reuse TCP/TLS connections
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=HTTP_POOL_SIZE,
+                    max_keepalive_connections=max(1, HTTP_POOL_SIZE // 2)
+                ),
+                timeout=HTTP_TIMEOUT
+            )
+            self.portkey = AsyncPortkey(
                 api_key=PORTKEY_API_KEY,
                 provider=PORTKEY_PROVIDER,
-                base_url=PORTKEY_BASE_URL
+                base_url=PORTKEY_BASE_URL,
+                http_client=self._http_client
             )
             logger.info("Portkey client initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize Portkey client: {e}")
+            logger.error("Failed to initialize Portkey client: %s", e)
             raise RuntimeError(f"Failed to initialize Portkey client: {e}")
+        
+        self.cache = _build_llm_cache()
+        self.semantic_cache: Optional[SemanticCache] = None
+        if CACHE_ENABLED and SEMANTIC_CACHE_ENABLED:
+            self.semantic_cache = SemanticCache(
+                SEMANTIC_CACHE_MODEL, SEMANTIC_CACHE_THRESHOLD, SEMANTIC_CACHE_MAX_ENTRIES
+            )
+        self.rate_limiter = TokenBucket(RPM_LIMIT, TPM_LIMIT)
+        # Only built when coalescing is configured; otherwise judge calls skip the queue
+        self.batcher: Optional[AdaptiveBatcher] = None
+        if BATCH_SIZE > 1:
+            self.batcher = AdaptiveBatcher(self, BATCH_SIZE, FLUSH_INTERVAL_MS, context="custom_evaluation")
+    
+    async def __aenter__(self) -> "PortkeyAPIClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Stop batching and close the pooled HTTP connections"""
+        if self.batcher is not None:
+            await self.batcher.close()
+        await self.portkey.close()
+        await self._http_client.aclose()
+        logger.info("Portkey client closed")
     
     async def test_connection(self) -> bool:
-        """Test the Portkey connection"""
+        """
+        Test the Portkey connection with a single one-token completion.
+        
+        The probe bypasses the response cache, rate limiter and retries and gives up
+        after _CONNECTION_TEST_TIMEOUT seconds, so an unreachable provider does not
+        hold up application startup.
+        """
         try:
-            await self._call_api(
-                messages=[{"role": "user", "content": "test"}],
-                context="connection_test"
+            await asyncio.wait_for(
+                self.portkey.chat.completions.create(
+                    model=PORTKEY_MODEL,
+                    messages=[{"role": "user", "content": "test"}],
+                    max_tokens=1
+                ),
+                timeout=_CONNECTION_TEST_TIMEOUT
             )
             return True
+        except asyncio.TimeoutError:
+            logger.warning("Connection test timed out after %.0fs", _CONNECTION_TEST_TIMEOUT)
+            return False
         except Exception as e:
-            logger.warning(f"Connection test failed: {e}")
+            logger.warning("Connection test failed: %s", e)
             return False
     
     async def _call_api(
@@ -54,56 +592,262 @@ class PortkeyAPIClient:
         context: str = "api_call",
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-        retry_count: int = 0
+        stream: bool = False,
+        cache_scope: Optional[str] = None
     ) -> str:
         """
-        Centralized API call with retry logic and error handling
+        Centralized API call with response caching
         
         Args:
             messages: List of messages for the API call
             context: Context for logging (e.g., 'evaluation', 'summary')
             temperature: Temperature override
             max_tokens: Max tokens override
-            retry_count: Current retry attempt
-            
+            stream: Stream the response and return the first complete JSON object in it
+            cache_scope: Text that must match exactly for a semantic cache hit; None skips the semantic tier
+        
         Returns:
             Response content as string
-            
+        
         Raises:
-            Exception: If all retries fail
+            Exception: If all retries fail, or on a cache miss in replay mode
         """
-        try:
-            response = self.portkey.chat.completions.create(
-                model=PORTKEY_MODEL,
-                messages=messages,
-                temperature=temperature or DEFAULT_TEMPERATURE,
-                max_tokens=max_tokens or MAX_TOKENS_GENERATION
-            )
-            
-            content = response.choices[0].message.content
-            logger.info(f"Portkey API call successful for context: {context}")
+        temperature = temperature or DEFAULT_TEMPERATURE
+        max_tokens = max_tokens or MAX_TOKENS_GENERATION
+        
+        if not self.cache.applies_to(temperature):
+            return await self._create_completion(messages, context, temperature, max_tokens, stream)
+        
+        key = LLMCache.make_key(PORTKEY_MODEL, PORTKEY_PROVIDER, temperature, max_tokens, messages)
+        content = await self.cache.get(key)
+        if content is not None:
+            logger.info("LLM cache hit for context: %s", context)
             return content
-            
-        except Exception as e:
-            logger.error(f"Portkey API call failed for {context} (attempt {retry_count + 1}): {e}")
-            
-            # Retry logic
-            if retry_count < MAX_RETRIES:
-                await asyncio.sleep(RETRY_DELAY * (2 ** retry_count))  # Exponential backoff
-                return await self._call_api(
+        
+        embedding = None
+        if self.semantic_cache is not None and cache_scope is not None:
+            partition = LLMCache.make_key(
+                PORTKEY_MODEL, PORTKEY_PROVIDER, temperature, max_tokens,
+                [*messages[:-1], {"role": "cache_scope", "content": cache_scope}]
+            )
+            embedding = await self.semantic_cache.embed(messages[-1]["content"])
+            content = self.semantic_cache.get(partition, embedding)
+            if content is not None:
+                logger.info("Semantic cache hit for context: %s", context)
+                return content
+        
+        if self.cache.policy == "replay":
+            raise RuntimeError(f"No cached response for {context} in replay mode")
+        
+        content = await self._create_completion(messages, context, temperature, max_tokens, stream)
+        await self.cache.set(key, content)
+        if embedding is not None and self.cache.policy in ("enabled", "enabled_all"):
+            self.semantic_cache.set(partition, embedding, content)
+        return content
+    
+    async def _create_completion(
+        self,
+        messages: List[Dict[str, str]],
+        context: str,
+        temperature: float,
+        max_tokens: int,
+        stream: bool = False
+    ) -> str:
+        """
+        Portkey chat completion with retry logic and error handling
+        
+        Rate limits, server errors and network errors are retried with exponential
+        backoff and full jitter, so that calls which failed together (e.g. on a
+        provider 429) do not all retry at the same instant. Client errors such as
+        400 or 401 are raised immediately.
+        
+        Args:
+            messages: List of messages for the API call
+            context: Context for logging (e.g., 'evaluation', 'summary')
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            stream: Stream the response and return the first complete JSON object in it
+        
+        Returns:
+            Response content as string
+        
+        Raises:
+            Exception: If all retries fail, or the provider error is not retryable
+        """
+        estimated_tokens = 0
+        if self.rate_limiter.enabled:
+            estimated_tokens = sum(count_tokens(message["content"]) for message in messages) + max_tokens
+        
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                await self.rate_limiter.acquire(estimated_tokens)
+                response = await self.portkey.chat.completions.create(
+                    model=PORTKEY_MODEL,
                     messages=messages,
-                    context=context,
                     temperature=temperature,
                     max_tokens=max_tokens,
-                    retry_count=retry_count + 1
+                    stream=stream
                 )
-            else:
-                raise Exception(f"Portkey API failed after {MAX_RETRIES} retries: {str(e)}")
+            
+                content = await self._read_stream(response) if stream else response.choices[0].message.content
+                self.rate_limiter.on_success()
+                _CALL_ATTEMPTS.labels(context, "success").observe(attempt + 1)
+                logger.info("Portkey API call successful for context: %s", context)
+                return content
+        
+            except Exception as e:
+                logger.error("Portkey API call failed for %s (attempt %s): %s", context, attempt + 1, e)
+            
+                status_code = getattr(e, "status_code", None)
+                rate_limited = status_code == 429
+                if rate_limited:
+                    self.rate_limiter.on_rate_limited()
+            
+                if status_code in _NON_RETRYABLE_STATUS_CODES:
+                    _CALL_ATTEMPTS.labels(context, "rejected").observe(attempt + 1)
+                    raise
+                
+                if attempt == MAX_RETRIES:
+                    _CALL_ATTEMPTS.labels(context, "failed").observe(attempt + 1)
+                    raise Exception(f"Portkey API failed after {MAX_RETRIES} retries: {str(e)}") from e
+                
+                # With a rate limiter the next acquire() waits for the refilled budget instead
+                if not (rate_limited and self.rate_limiter.enabled):
+                    await asyncio.sleep(random.uniform(0, RETRY_DELAY * (2 ** attempt)))  # Exponential backoff, full jitter
+    
+    @staticmethod
+    async def _read_stream(chunks: AsyncIterator[Any]) -> str:
+        """
+        Read a streamed completion until its first JSON object is complete
+        
+        The stream is closed as soon as the object's closing brace arrives, so any
+        trailing text is never received. Returns the whole text if no object closes.
+        """
+        scanner = JSONObjectScanner()
+        try:
+            async for chunk in chunks:
+                if not chunk.choices or chunk.choices[0].delta is None:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                json_object = scanner.feed(delta)
+                if json_object is not None:
+                    return json_object
+            return scanner.text
+        finally:
+            await chunks.aclose()
+    
+    async def call_batch(
+        self,
+        message_batches: List[List[Dict[str, str]]],
+        context: str = "batch",
+        cache_scopes: Optional[List[Optional[str]]] = None
+    ) -> List[Union[str, BaseException]]:
+        """
+        Run several chat completions concurrently
+        
+        Args:
+            message_batches: One list of messages per completion
+            context: Context for logging
+            cache_scopes: Semantic cache scope per completion (see _call_api)
+        
+        Returns:
+            Response content per completion, in input order, or the exception it raised
+        """
+        return await asyncio.gather(
+            *[
+                self._call_api(messages, context=context, cache_scope=cache_scope)
+                for messages, cache_scope in zip(message_batches, cache_scopes or [None] * len(message_batches))
+            ],
+            return_exceptions=True
+        )
+    
+    async def get_cached_response(self, messages: List[Dict[str, str]]) -> Optional[str]:
+        """Return the exact-match cached response for messages at default settings, if any"""
+        if not self.cache.applies_to(DEFAULT_TEMPERATURE):
+            return None
+        key = LLMCache.make_key(PORTKEY_MODEL, PORTKEY_PROVIDER, DEFAULT_TEMPERATURE, MAX_TOKENS_GENERATION, messages)
+        return await self.cache.get(key)
+    
+    async def submit_batch(
+        self,
+        requests: List[Tuple[str, List[Dict[str, str]]]],
+        metadata: Dict[str, str]
+    ) -> str:
+        """
+        Submit chat completions to the provider Batch API
+        
+        Batch jobs finish within 24 hours at roughly half the synchronous price,
+        which suits evaluations the caller does not wait on.
+        
+        Args:
+            requests: (custom_id, messages) per completion
+            metadata: String metadata stored with the batch and returned on retrieval
+        
+        Returns:
+            The batch id
+        """
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": PORTKEY_MODEL,
+                    "messages": messages,
+                    "temperature": DEFAULT_TEMPERATURE,
+                    "max_tokens": MAX_TOKENS_GENERATION
+                }
+            })
+            for custom_id, messages in requests
+        ]
+        batch_input = await self.portkey.files.create(
+            file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await self.portkey.batches.create(
+            completion_window="24h",
+            endpoint="/v1/chat/completions",
+            input_file_id=batch_input.id,
+            metadata=metadata
+        )
+        logger.info("Submitted batch %s with %s request(s)", batch.id, len(requests))
+        return batch.id
+    
+    async def retrieve_batch(self, batch_id: str) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        """
+        Poll a batch submitted with submit_batch
+        
+        Args:
+            batch_id: The batch id
+        
+        Returns:
+            The batch status, its metadata and, once completed, the response
+            content per custom_id (failed requests are left out)
+        """
+        batch = await self.portkey.batches.retrieve(batch_id)
+        metadata = dict(batch.metadata or {})
+        outputs: Dict[str, str] = {}
+        if batch.status != "completed" or not batch.output_file_id:
+            return batch.status, metadata, outputs
+        
+        batch_output = await self.portkey.files.content(batch.output_file_id)
+        for line in batch_output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.error("Batch %s request %s failed: %s", batch_id, record.get("custom_id"), record.get("error"))
+                continue
+            outputs[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return batch.status, metadata, outputs
     
     async def call_for_evaluation(self, prompt: str) -> str:
         """Call API for metric evaluation"""
         messages = [
-            {"role": "system", "content": SYSTEM_PROMPTS["evaluation"]},
+            _EVALUATION_SYSTEM_MESSAGE,
             {"role": "user", "content": prompt}
         ]
         return await self._call_api(messages, context="evaluation")
@@ -111,7 +855,7 @@ class PortkeyAPIClient:
     async def call_for_summary(self, prompt: str) -> str:
         """Call API for summary generation"""
         messages = [
-            {"role": "system", "content": SYSTEM_PROMPTS["summary"]},
+            _SUMMARY_SYSTEM_MESSAGE,
             {"role": "user", "content": prompt}
         ]
         return await self._call_api(messages, context="summary", max_tokens=MAX_TOKENS_SUMMARY)
@@ -119,15 +863,23 @@ class PortkeyAPIClient:
     async def call_for_recommendations(self, prompt: str) -> str:
         """Call API for recommendations generation"""
         messages = [
-            {"role": "system", "content": SYSTEM_PROMPTS["recommendations"]},
+            _RECOMMENDATIONS_SYSTEM_MESSAGE,
             {"role": "user", "content": prompt}
         ]
         return await self._call_api(messages, context="recommendations", max_tokens=MAX_TOKENS_RECOMMENDATIONS)
     
-    async def call_with_system_prompt(self, system_prompt: str, user_message: str) -> str:
-        """Call API with custom system prompt"""
+    async def call_with_system_prompt(
+        self,
+        system_prompt: str,
+        user_message: str,
+        stream: bool = False,
+        cache_scope: Optional[str] = None
+    ) -> str:
+        """Call API with custom system prompt; streamed calls are sent on their own, not batched"""
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_message}
         ]
-        return await self._call_api(messages, context="custom_evaluation")
+        if stream or self.batcher is None:
+            return await self._call_api(messages, context="custom_evaluation", stream=stream, cache_scope=cache_scope)
+        return await self.batcher.submit(messages, cache_scope)
@@ -4,46 +4,160 @@ Business Service for Evaluation Operations.
 This module contains the core business logic for content evaluation,
 separated from the API layer concerns.
 """
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Mapping, Optional, Tuple
 from src.api.backlog_evaluator_contracts import EvaluationInput, EvaluationResult
-from src.service.evaluators import DeepEvalEvaluator
 from src.config.config import logger
 
+if TYPE_CHECKING:
+    from src.service.evaluators import DeepEvalEvaluator
+
+
+# Descriptions and weights of the evaluation metrics; the payload is static, so it
+# is built once rather than on every /metrics/info call
+_METRICS_INFO: Mapping[str, Any] = MappingProxyType({
+    "metrics": (
+        {
+            "name": "relevance",
+            "weight": 0.18,
+            "description": "How well the content addresses the user's prompt"
+        },
+        {
+            "name": "accuracy", 
+            "weight": 0.15,
+            "description": "Factual correctness and technical accuracy"
+        },
+        {
+            "name": "completeness",
+            "weight": 0.15, 
+            "description": "Whether all necessary sections are included"
+        },
+        {
+            "name": "clarity",
+            "weight": 0.12,
+            "description": "Readability and professional language"
+        },
+        {
+            "name": "structure",
+            "weight": 0.08,
+            "description": "Proper formatting and organization"
+        },
+        {
+            "name": "consistency",
+            "weight": 0.08,
+            "description": "Internal consistency and alignment with context"
+        },
+        {
+            "name": "hallucination_detection",
+            "weight": 0.12,
+            "description": "Identifies and penalizes fabricated or unsupported claims"
+        },
+        {
+            "name": "context_adherence",
+            "weight": 0.08,
+            "description": "Alignment with provided contextual information"
+        },
+        {
+            "name": "factual_grounding",
+            "weight": 0.04,
+            "description": "Verification of claims against reliable sources"
+        }
+    ),
+    "scoring": {
+        "range": "0.0 to 1.0",
+        "excellent": "> 0.8",
+        "good": "0.7 - 0.8", 
+        "needs_improvement": "< 0.7"
+    }
+})
+
+
+@lru_cache(maxsize=1)
+def _get_evaluator() -> "DeepEvalEvaluator":
+    """Process-wide evaluator, so every service instance shares one warm API client and its connection pool"""
+    # Imported here: the evaluator pulls in deepeval, numpy and the Portkey client, which
+    # is only needed once a service is created (in the API lifespan), not at import time
+    from src.service.evaluators import DeepEvalEvaluator
+    return DeepEvalEvaluator()
+
 
 class EvaluationService:
     """Service class that handles the business logic for content evaluation."""
     
     def __init__(self):
         """Initialize the evaluation service with required components."""
-        self.evaluator = DeepEvalEvaluator()
+        self.evaluator = _get_evaluator()
+    
+    async def aclose(self) -> None:
+        """Release the evaluator's client resources and drop the shared evaluator."""
+        await self.evaluator.api_client.aclose()
+        # The closed evaluator's HTTP client and batcher are bound to this event loop; the
+        # next service (e.g. a later lifespan in the same process) must build a fresh one
+        _get_evaluator.cache_clear()
     
-    async def evaluate_content(self, evaluation_input: EvaluationInput) -> EvaluationResult:
+    async def test_connection(self) -> None:
+        """Verify the evaluator can reach the LLM provider; failures are logged, not raised."""
+        await self.evaluator._test_connection()
+    
+    async def evaluate_content(self, evaluation_input: EvaluationInput, now_iso: Optional[str] = None) -> EvaluationResult:
         """
         Evaluate content using the configured evaluator.
         
         Args:
             evaluation_input: The content and context to evaluate
+            now_iso: Request timestamp to record on the result (default: now)
             
         Returns:
             EvaluationResult: Complete evaluation results
             
         Raises:
-            Exception: If evaluation fails
+            Exception: If evaluation fails (logged by the API layer)
         """
-        try:
-            logger.info(f"Service: Starting evaluation for session: {evaluation_input.session_id}")
+        logger.info("Service: Starting evaluation for session: %s", evaluation_input.session_id)
             
-            # Perform evaluation using the DeepEval evaluator
-            result = await self.evaluator.evaluate_all(evaluation_input)
+        # Perform evaluation using the DeepEval evaluator
+        result = await self.evaluator.evaluate_all(evaluation_input, now_iso)
             
-            logger.info(f"Service: Evaluation completed for session: {evaluation_input.session_id}")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Service: Evaluation failed for session {evaluation_input.session_id}: {str(e)}")
-            raise e
+        logger.info("Service: Evaluation completed for session: %s", evaluation_input.session_id)
+        return result
     
-    async def check_health(self) -> Dict[str, Any]:
+    async def submit_batch_evaluation(self, evaluation_input: EvaluationInput) -> Optional[str]:
+        """
+        Submit content for evaluation through the provider Batch API.
+        
+        Args:
+            evaluation_input: The content and context to evaluate
+        
+        Returns:
+            The batch id to poll, or None if the evaluation is cached and should run synchronously
+        
+        Raises:
+            Exception: If submission fails (logged by the API layer)
+        """
+        batch_id = await self.evaluator.submit_batch_evaluation(evaluation_input)
+        logger.info("Service: Batch %s submitted for session: %s", batch_id, evaluation_input.session_id)
+        return batch_id
+    
+    async def collect_batch_evaluation(
+        self, batch_id: str, now_iso: Optional[str] = None
+    ) -> Tuple[str, Dict[str, str], Optional[EvaluationResult]]:
+        """
+        Poll a batch evaluation.
+        
+        Args:
+            batch_id: The id returned by submit_batch_evaluation
+            now_iso: Request timestamp to record on a completed result (default: now)
+        
+        Returns:
+            The batch status, its metadata and the evaluation result once completed
+        
+        Raises:
+            Exception: If the batch cannot be retrieved (logged by the API layer)
+        """
+        return await self.evaluator.collect_batch_evaluation(batch_id, now_iso)
+    
+    def check_health(self) -> Dict[str, Any]:
         """
         Check the health status of the evaluation service.
         
@@ -70,14 +184,14 @@ class EvaluationService:
             }
             
         except Exception as e:
-            logger.error(f"Service: Health check failed: {str(e)}")
+            logger.error("Service: Health check failed: %s", e)
             return {
                 "is_healthy": False,
                 "service_status": "error",
                 "error": str(e)
             }
     
-    async def get_metrics_info(self) -> Dict[str, Any]:
+    def get_metrics_info(self) -> Dict[str, Any]:
         """
         Get information about available evaluation metrics and their weights.
         
@@ -85,64 +199,16 @@ class EvaluationService:
             Dict containing metrics information
         """
         try:
-            # This could be moved to a configuration or metadata service
-            # For now, keeping the same structure as the original implementation
+            # The static part is built once at import; only the cache stats change per call
             return {
-                "metrics": [
-                    {
-                        "name": "relevance",
-                        "weight": 0.18,
-                        "description": "How well the content addresses the user's prompt"
-                    },
-                    {
-                        "name": "accuracy", 
-                        "weight": 0.15,
-                        "description": "Factual correctness and technical accuracy"
-                    },
-                    {
-                        "name": "completeness",
-                        "weight": 0.15, 
-                        "description": "Whether all necessary sections are included"
-                    },
-                    {
-                        "name": "clarity",
-                        "weight": 0.12,
-                        "description": "Readability and professional language"
-                    },
-                    {
-                        "name": "structure",
-                        "weight": 0.08,
-                        "description": "Proper formatting and organization"
-                    },
-                    {
-                        "name": "consistency",
-                        "weight": 0.08,
-                        "description": "Internal consistency and alignment with context"
-                    },
-                    {
-                        "name": "hallucination_detection",
-                        "weight": 0.12,
-                        "description": "Identifies and penalizes fabricated or unsupported claims"
-                    },
-                    {
-                        "name": "context_adherence",
-                        "weight": 0.08,
-                        "description": "Alignment with provided contextual information"
-                    },
-                    {
-                        "name": "factual_grounding",
-                        "weight": 0.04,
-                        "description": "Verification of claims against reliable sources"
-                    }
-                ],
-                "scoring": {
-                    "range": "0.0 to 1.0",
-                    "excellent": "> 0.8",
-                    "good": "0.7 - 0.8", 
-                    "needs_improvement": "< 0.7"
-                }
+                **_METRICS_INFO,
+                "cache": dict(self.evaluator.api_client.cache.stats),
+                "semantic_cache": (
+                    dict(self.evaluator.api_client.semantic_cache.stats)
+                    if self.evaluator.api_client.semantic_cache is not None else None
+                )
             }
             
-        except Exception as e:
-            logger.error(f"Service: Failed to get metrics info: {str(e)}")
-            raise e
+        except Exception:
+            logger.exception("Service: Failed to get metrics info")
+            raise
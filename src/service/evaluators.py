@@ -1,11 +1,17 @@
 """
 Evaluation logic for the Response Evaluator Agent API.
 """
-import json
+import hashlib
+import math
+import orjson
+import random
 import re
 import asyncio
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+import numpy as np
+from cachetools import TTLCache
 
 from deepeval import evaluate
 from deepeval.metrics import AnswerRelevancyMetric, FaithfulnessMetric, ContextualPrecisionMetric, ContextualRecallMetric
@@ -13,36 +19,99 @@ from deepeval.test_case import LLMTestCase
 
 from src.api.backlog_evaluator_contracts import EvaluationInput, EvaluationMetric, MetricScore, EvaluationResult
 from src.service.clients import PortkeyAPIClient
-from src.service.prompts import EVALUATION_PROMPTS
-from src.config.config import DEEPEVAL_THRESHOLD, METRIC_WEIGHTS, logger
+from src.service.prompts import EVALUATION_PROMPTS, REQUEST_SYSTEM_PROMPTS
+from src.service.scoring import EXPECTED_METRICS, compute_overall
+from src.utils.tokens import count_tokens
+from src.config.config import (
+    DEEPEVAL_THRESHOLD,
+    METRIC_FALLBACK,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_MAXSIZE,
+    RESPONSE_CACHE_TTL,
+    STREAM_JUDGE,
+    logger
+)
+
+# Caps DeepEval metric measurements in flight across all requests, so parallel
+# metrics do not run into provider rate limits
+_DEEPEVAL_SEMAPHORE = asyncio.Semaphore(4)
+
+# Judge responses per (system_prompt, user_message) digest; opt-in because a cache
+# hit repeats one sample of a non-deterministic (temperature > 0) judge
+_response_cache: Optional[TTLCache] = (
+    TTLCache(maxsize=RESPONSE_CACHE_MAXSIZE, ttl=RESPONSE_CACHE_TTL) if RESPONSE_CACHE_ENABLED else None
+)
+
+# Finished batch evaluations per batch_id, so polling a completed batch serves the stored
+# result instead of re-running the summary and recommendations calls; providers keep
+# batch output for about a day
+_batch_results: TTLCache = TTLCache(maxsize=1024, ttl=24 * 60 * 60)
+
+# Seconds a successful connection test is trusted before the provider is probed again
+_CONNECTION_VERIFIED_TTL = 300
+
+# Source of the score variation applied to validation results
+_rng = random.Random()
+
+# Outermost {...} span of an LLM response that wraps its JSON in extra text
+_JSON_ENVELOPE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def _extract_json(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the JSON object in an LLM response.
+    
+    The response is parsed as-is first; only if that fails is the JSON envelope
+    located and parsed. Returns None if the response has no {...} span and raises
+    orjson.JSONDecodeError if the span is not valid JSON.
+    """
+    try:
+        data = orjson.loads(text)
+        if isinstance(data, dict):
+            return data
+    except orjson.JSONDecodeError:
+        pass
+    
+    match = _JSON_ENVELOPE.search(text)
+    if match is None:
+        return None
+    return orjson.loads(match.group(0))
 
 
 class DeepEvalEvaluator:
     """DeepEval-based evaluator with LangChain and Portkey AI integration"""
     
+    # Monotonic deadline of the last successful connection test, shared by all instances in the process
+    _conn_verified_until: float = 0.0
+    
     def __init__(self):
         # Initialize centralized API client
         self.api_client = PortkeyAPIClient()
         
-        # Connection will be tested on first use instead of during initialization
+        # Connection is tested once at application startup (see the API lifespan)
         self._connection_tested = False
             
     async def _test_connection(self):
-        """Test API connection asynchronously"""
+        """Test API connection asynchronously, skipping the call while a recent test is still valid"""
+        if time.monotonic() < DeepEvalEvaluator._conn_verified_until:
+            self._connection_tested = True
+            return
         try:
             connection_ok = await self.api_client.test_connection()
+            self._connection_tested = connection_ok
             if connection_ok:
+                DeepEvalEvaluator._conn_verified_until = time.monotonic() + _CONNECTION_VERIFIED_TTL
                 logger.info("Portkey connection verified")
             else:
                 logger.warning("Portkey connection test failed")
         except Exception as e:
-            logger.error(f"Connection test error: {e}")
+            logger.error("Connection test error: %s", e)
 
     async def evaluate_with_deepeval(self, evaluation_input: EvaluationInput) -> Dict[str, Any]:
         """Evaluate using DeepEval metrics"""
         
         # Prepare context string
-        context_str = "\n".join([item.content for item in evaluation_input.context])
+        context_str = "\n".join(item.content for item in evaluation_input.context)
         retrieval_contexts = [context_str]
         
         # Create LLMTestCase for DeepEval
@@ -62,67 +131,137 @@ class DeepEvalEvaluator:
         
         results = {}
         
-        # Evaluate each metric
-        for metric_name, metric in metrics.items():
-            try:
-                # Run the metric evaluation
-                await asyncio.to_thread(metric.measure, test_case)
+        # Evaluate all metrics concurrently; each measure() blocks on LLM calls
+        outcomes = await asyncio.gather(
+            *[self._measure(metric, test_case) for metric in metrics.values()],
+            return_exceptions=True
+        )
+        
+        for (metric_name, metric), outcome in zip(metrics.items(), outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Error evaluating %s: %s", metric_name, outcome)
+                results[metric_name] = {
+                    "score": 0,
+                    "reason": f"Error during evaluation: {str(outcome)}",
+                    "success": False
+                }
+            else:
                 results[metric_name] = {
                     "score": metric.score,
                     "reason": metric.reason,
                     "success": metric.success
                 }
-                logger.info(f"DeepEval {metric_name}: {metric.score:.3f}")
-            except Exception as e:
-                logger.error(f"Error evaluating {metric_name}: {str(e)}")
-                results[metric_name] = {
-                    "score": 0,
-                    "reason": f"Error during evaluation: {str(e)}",
-                    "success": False
-                }
+                logger.info("DeepEval %s: %.3f", metric_name, metric.score)
         
         return results
+    
+    @staticmethod
+    async def _measure(metric: Any, test_case: LLMTestCase) -> None:
+        """Run a blocking DeepEval metric measurement in a worker thread"""
+        async with _DEEPEVAL_SEMAPHORE:
+            await asyncio.to_thread(metric.measure, test_case)
         
     async def evaluate_all_metrics(self, evaluation_input: EvaluationInput) -> List[MetricScore]:
         """Evaluate all metrics using the provided system_prompt"""
         try:
             # Check if this is the new validation system prompt format
-            if "validation agent" in evaluation_input.system_prompt.lower():
+            if self._is_validation_prompt(evaluation_input.system_prompt):
                 return await self._handle_validation_prompt(evaluation_input)
             else:
                 return await self._handle_evaluation_prompt(evaluation_input)
             
         except Exception as e:
-            logger.error(f"Error during evaluation: {str(e)}")
+            logger.error("Error during evaluation: %s", e)
             return self._get_default_metric_scores(f"Evaluation error: {str(e)}")
     
-    async def _handle_validation_prompt(self, evaluation_input: EvaluationInput) -> List[MetricScore]:
-        """Handle the new validation system prompt that returns binary proceed/reason format"""
-        try:
-            # Create the user message in the expected validation format
-            input_data = {
-                "input": {
-                    "context": [{"content": item.content} for item in evaluation_input.context],
-                    "template": evaluation_input.template,
-                    "user_request": evaluation_input.user_prompt
-                },
-                "output": {
-                    "backlog_type": evaluation_input.backlog_type,
-                    "generated_content": {
-                        "title": evaluation_input.generated_content.title,
-                        "formatted_output": evaluation_input.generated_content.formatted_output
-                    }
+    @staticmethod
+    def _is_validation_prompt(system_prompt: str) -> bool:
+        """Whether the system prompt uses the validation agent's binary proceed/reason format"""
+        return "validation agent" in system_prompt.lower()
+    
+    def _build_validation_message(self, evaluation_input: EvaluationInput) -> str:
+        """Build the user message in the expected validation format"""
+        input_data = {
+            "input": {
+                "context": [{"content": item.content} for item in evaluation_input.context],
+                "template": evaluation_input.template,
+                "user_request": evaluation_input.user_prompt
+            },
+            "output": {
+                "backlog_type": evaluation_input.backlog_type,
+                "generated_content": {
+                    "title": evaluation_input.generated_content.title,
+                    "formatted_output": evaluation_input.generated_content.formatted_output
                 }
             }
+        }
+        
+        # Compact JSON: indentation only inflates the prompt tokens sent to the LLM
+        return orjson.dumps(input_data).decode()
+    
+    def _build_evaluation_message(self, evaluation_input: EvaluationInput) -> str:
+        """Build the user message carrying all the evaluation data"""
+        # Prepare context string
+        context_str = " | ".join(item.content for item in evaluation_input.context)
+        
+        return f"""
+            Please evaluate the following content:
             
-            user_message = json.dumps(input_data, indent=2)
+            USER_PROMPT: {evaluation_input.user_prompt}
+            TEMPLATE: {evaluation_input.template}
+            BACKLOG_TYPE: {evaluation_input.backlog_type}
+            GENERATED_TITLE: {evaluation_input.generated_content.title}
+            GENERATED_CONTENT: {evaluation_input.generated_content.formatted_output}
+            CONTEXT: {context_str}
+            """
+    
+    @staticmethod
+    def _response_cache_key(system_prompt: str, user_message: str) -> bytes:
+        """Digest identifying a judge call in the response cache"""
+        return hashlib.blake2b(f"{system_prompt}\x00{user_message}".encode("utf-8")).digest()
+    
+    @staticmethod
+    def _cache_scope(evaluation_input: EvaluationInput) -> str:
+        """Generated item a judge response belongs to; semantic cache hits must match it exactly"""
+        return f"{evaluation_input.generated_content.title}\x00{evaluation_input.generated_content.formatted_output}"
+    
+    async def _cached_call(self, system_prompt: str, user_message: str, cache_scope: str) -> str:
+        """Call the judge with a custom system prompt, reusing cached responses when enabled"""
+        if _response_cache is None:
+            return await self.api_client.call_with_system_prompt(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                stream=STREAM_JUDGE,
+                cache_scope=cache_scope
+            )
+        
+        key = self._response_cache_key(system_prompt, user_message)
+        response_content = _response_cache.get(key)
+        if response_content is not None:
+            logger.info("Judge response cache hit")
+            return response_content
+        
+        response_content = await self.api_client.call_with_system_prompt(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            stream=STREAM_JUDGE,
+            cache_scope=cache_scope
+        )
+        _response_cache[key] = response_content
+        return response_content
+    
+    async def _handle_validation_prompt(self, evaluation_input: EvaluationInput) -> List[MetricScore]:
+        """Handle the new validation system prompt that returns binary proceed/reason format"""
+        try:
+            user_message = self._build_validation_message(evaluation_input)
             
             # Call API using the system_prompt from input
-            response_content = await self.api_client.call_with_system_prompt(
+            response_content = await self._cached_call(
                 system_prompt=evaluation_input.system_prompt,
-                user_message=user_message
+                user_message=user_message,
+                cache_scope=self._cache_scope(evaluation_input)
             )
-            logger.info(f"AI validation response: {response_content}")
+            logger.info("AI validation response: %s", response_content)
             
             # Parse the validation response
             validation_result = await self._parse_validation_response(response_content)
@@ -131,34 +270,67 @@ class DeepEvalEvaluator:
             return self._convert_validation_to_metrics(validation_result)
             
         except Exception as e:
-            logger.error(f"Error during validation evaluation: {str(e)}")
+            logger.error("Error during validation evaluation: %s", e)
             return self._get_default_metric_scores(f"Validation error: {str(e)}")
     
     async def _handle_evaluation_prompt(self, evaluation_input: EvaluationInput) -> List[MetricScore]:
         """Handle the original evaluation system prompt format"""
         try:
-            # Prepare context string
-            context_str = " | ".join([item.content for item in evaluation_input.context])
-            
-            # Create the user message with all the evaluation data
-            user_message = f"""
-            Please evaluate the following content:
-
-            USER_PROMPT: {evaluation_input.user_prompt}
-            TEMPLATE: {evaluation_input.template}
-            BACKLOG_TYPE: {evaluation_input.backlog_type}
-            GENERATED_TITLE: {evaluation_input.generated_content.title}
-            GENERATED_CONTENT: {evaluation_input.generated_content.formatted_output}
-            CONTEXT: {context_str}
-            """
+            user_message = self._build_evaluation_message(evaluation_input)
             
             # Call API using the system_prompt from input
-            response_content = await self.api_client.call_with_system_prompt(
+            response_content = await self._cached_call(
                 system_prompt=evaluation_input.system_prompt,
-                user_message=user_message
+                user_message=user_message,
+                cache_scope=self._cache_scope(evaluation_input)
             )
-            logger.info(f"AI response for evaluation: {response_content}")
+            logger.info("AI response for evaluation: %s", response_content)
+            
+            if not METRIC_FALLBACK:
+                return self._parse_evaluation_response(response_content)
             
+            # Metrics the combined response did not score are judged one by one, concurrently
+            try:
+                evaluation_data = _extract_json(response_content.strip()) or {}
+            except orjson.JSONDecodeError:
+                evaluation_data = {}
+            missing = [metric_name for metric_name in EXPECTED_METRICS if metric_name not in evaluation_data]
+            if missing:
+                logger.warning("Judge response is missing metrics %s, scoring them individually", missing)
+                fallback_data = await asyncio.gather(
+                    *(
+                        self._evaluate_single_metric(metric_name, user_message, self._cache_scope(evaluation_input))
+                        for metric_name in missing
+                    )
+                )
+                evaluation_data = {
+                    **evaluation_data,
+                    **{name: data for name, data in zip(missing, fallback_data) if data is not None}
+                }
+            return self._scores_from_data(evaluation_data)
+        
+        except Exception as e:
+            logger.error("Error during evaluation: %s", e)
+            return self._get_default_metric_scores(f"Evaluation error: {str(e)}")
+    
+    async def _evaluate_single_metric(
+        self, metric_name: str, user_message: str, cache_scope: str
+    ) -> Optional[Dict[str, Any]]:
+        """Score one metric with its own system prompt; returns its {"score", ...} entry or None on failure"""
+        try:
+            response_content = await self._cached_call(
+                system_prompt=REQUEST_SYSTEM_PROMPTS[metric_name],
+                user_message=user_message,
+                cache_scope=cache_scope
+            )
+            return _extract_json(response_content.strip())
+        except Exception as e:
+            logger.error("Error scoring metric %s individually: %s", metric_name, e)
+            return None
+    
+    def _parse_evaluation_response(self, response_content: str) -> List[MetricScore]:
+        """Parse the JSON evaluation response into metric scores"""
+        try:
             # Clean the response content
             response_content = response_content.strip()
             
@@ -167,72 +339,15 @@ class DeepEvalEvaluator:
                 logger.error("Empty response from AI")
                 return self._get_default_metric_scores("Empty response from AI")
             
-            # Try to extract JSON from response if it contains extra text
-            json_start = response_content.find('{')
-            json_end = response_content.rfind('}') + 1
-            
-            if json_start != -1 and json_end > json_start:
-                json_content = response_content[json_start:json_end]
-                logger.info(f"Extracted JSON content: {json_content}")
-            else:
-                logger.error(f"No JSON found in response: {response_content}")
-                return self._get_default_metric_scores(f"No JSON found in response")
-            
-            # Try to parse JSON response
+            # Try to parse JSON response, extracting it if it contains extra text
             try:
-                evaluation_data = json.loads(json_content)
-                
-                # Convert the response to MetricScore objects
-                metric_scores = []
-                expected_metrics = ["relevance", "accuracy", "completeness", "clarity", "structure", "consistency", "hallucination_detection", "context_adherence", "factual_grounding"]
+                evaluation_data = _extract_json(response_content)
+                if evaluation_data is None:
+                    logger.error("No JSON found in response: %s", response_content)
+                    return self._get_default_metric_scores(f"No JSON found in response")
+                logger.info("Extracted JSON content: %s", evaluation_data)
                 
-                for metric_name in expected_metrics:
-                    if metric_name in evaluation_data:
-                        metric_data = evaluation_data[metric_name]
-                        if isinstance(metric_data, dict) and "score" in metric_data:
-                            score_value = round(min(max(float(metric_data["score"]), 0.0), 1.0), 2)  # Clamp between 0 and 1
-                            # Only include reasoning if score is less than 0.65
-                            if score_value < 0.65:
-                                metric_scores.append(MetricScore(
-                                    metric=metric_name,
-                                    score=score_value,
-                                    reasoning=metric_data.get("reasoning", "No reasoning provided"),
-                                    confidence=min(max(float(metric_data.get("confidence", 0.8)), 0.0), 1.0)
-                                ))
-                            else:
-                                metric_scores.append(MetricScore(
-                                    metric=metric_name,
-                                    score=score_value,
-                                    reasoning=None,
-                                    confidence=min(max(float(metric_data.get("confidence", 0.8)), 0.0), 1.0)
-                                ))
-                        else:
-                            # Handle case where metric_data is just a score value
-                            score = float(metric_data) if isinstance(metric_data, (int, float)) else 0.5
-                            score_value = round(min(max(score, 0.0), 1.0), 2)
-                            # Only include reasoning if score is less than 0.65
-                            if score_value < 0.65:
-                                metric_scores.append(MetricScore(
-                                    metric=metric_name,
-                                    score=score_value,
-                                    reasoning="Score provided without detailed reasoning",
-                                    confidence=0.7
-                                ))
-                            else:
-                                metric_scores.append(MetricScore(
-                                    metric=metric_name,
-                                    score=score_value,
-                                    reasoning=None,
-                                    confidence=0.7
-                                ))
-                    else:
-                        # Add default score for missing metrics (always show reasoning for missing metrics as they default to 0.5)
-                        metric_scores.append(MetricScore(
-                            metric=metric_name,
-                            score=0.5,
-                            reasoning=f"Metric {metric_name} not found in AI response",
-                            confidence=0.3
-                        ))
+                metric_scores = self._scores_from_data(evaluation_data)
                 
                 if not metric_scores:
                     logger.error("No valid metric scores extracted from response")
@@ -240,45 +355,103 @@ class DeepEvalEvaluator:
                 
                 return metric_scores
                 
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON content: {json_content}, Error: {str(e)}")
+            except orjson.JSONDecodeError as e:
+                logger.error("Failed to parse JSON content: %s, Error: %s", response_content, e)
                 return self._get_default_metric_scores(f"JSON parsing error: {str(e)}")
             
         except Exception as e:
-            logger.error(f"Error during evaluation: {str(e)}")
+            logger.error("Error during evaluation: %s", e)
             return self._get_default_metric_scores(f"Evaluation error: {str(e)}")
     
+    def _scores_from_data(self, evaluation_data: Dict[str, Any]) -> List[MetricScore]:
+        """Convert the judge's per-metric JSON entries to MetricScore objects in EXPECTED_METRICS order"""
+        raw_scores = np.array([self._raw_score(evaluation_data.get(metric_name)) for metric_name in EXPECTED_METRICS])
+        if not np.isfinite(raw_scores).all():
+            # NaN/inf would survive clamping and poison the overall score
+            raise ValueError("Judge response contains a non-finite score")
+        
+        # Clamp all scores between 0 and 1 and round them in one pass
+        score_values = np.clip(raw_scores, 0.0, 1.0).round(2).tolist()
+        
+        return [
+            self._build_metric(metric_name, evaluation_data, score_value)
+            for metric_name, score_value in zip(EXPECTED_METRICS, score_values)
+        ]
+    
+    @staticmethod
+    def _raw_score(metric_data: Any) -> float:
+        """Unclamped score from a metric entry: a {"score": ...} dict or a bare number, else 0.5"""
+        if isinstance(metric_data, dict) and "score" in metric_data:
+            return float(metric_data["score"])
+        if isinstance(metric_data, (int, float)):
+            return float(metric_data)
+        return 0.5
+    
+    @staticmethod
+    def _build_metric(metric_name: str, evaluation_data: Dict[str, Any], score_value: float) -> MetricScore:
+        """
+        Build a MetricScore from the judge response's entry for a metric and its clamped score.
+        
+        Every field is clamped or coerced here, so the model is built without validation.
+        """
+        if metric_name not in evaluation_data:
+            # Missing metrics default to 0.5, so always show reasoning
+            return MetricScore.model_construct(
+                metric=metric_name,
+                score=0.5,
+                reasoning=f"Metric {metric_name} not found in AI response",
+                confidence=0.3
+            )
+        
+        metric_data = evaluation_data[metric_name]
+        if isinstance(metric_data, dict) and "score" in metric_data:
+            reasoning = metric_data.get("reasoning") or "No reasoning provided"
+            if not isinstance(reasoning, str):
+                reasoning = str(reasoning)
+            confidence = float(metric_data.get("confidence", 0.8))
+            if not math.isfinite(confidence):
+                raise ValueError(f"Judge response contains a non-finite confidence for {metric_name}")
+            confidence = min(max(confidence, 0.0), 1.0)
+        else:
+            # Handle case where metric_data is just a score value
+            reasoning = "Score provided without detailed reasoning"
+            confidence = 0.7
+        
+        # Only include reasoning if score is less than 0.65
+        return MetricScore.model_construct(
+            metric=metric_name,
+            score=score_value,
+            reasoning=reasoning if score_value < 0.65 else None,
+            confidence=confidence
+        )
+    
     async def _parse_validation_response(self, response_content: str) -> Dict[str, Any]:
         """Parse the validation response and extract proceed/reason"""
         try:
             # Clean the response content
             response_content = response_content.strip()
             
-            # Try to extract JSON from response if it contains extra text
-            json_start = response_content.find('{')
-            json_end = response_content.rfind('}') + 1
+            # Try to parse JSON from response, extracting it if it contains extra text
+            validation_data = _extract_json(response_content)
             
-            if json_start != -1 and json_end > json_start:
-                json_content = response_content[json_start:json_end]
-                logger.info(f"Extracted validation JSON: {json_content}")
-                
-                validation_data = json.loads(json_content)
+            if validation_data is not None:
+                logger.info("Extracted validation JSON: %s", validation_data)
                 
                 # Ensure we have the expected format
                 if "proceed" in validation_data and "reason" in validation_data:
                     return validation_data
                 else:
-                    logger.error(f"Invalid validation response format: {validation_data}")
+                    logger.error("Invalid validation response format: %s", validation_data)
                     return {"proceed": False, "reason": "Invalid response format from validation agent"}
             else:
-                logger.error(f"No JSON found in validation response: {response_content}")
+                logger.error("No JSON found in validation response: %s", response_content)
                 return {"proceed": False, "reason": "No valid JSON found in validation response"}
                 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse validation JSON: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse validation JSON: %s", e)
             return {"proceed": False, "reason": f"JSON parsing error: {str(e)}"}
         except Exception as e:
-            logger.error(f"Error parsing validation response: {str(e)}")
+            logger.error("Error parsing validation response: %s", e)
             return {"proceed": False, "reason": f"Parsing error: {str(e)}"}
     
     def _convert_validation_to_metrics(self, validation_result: Dict[str, Any]) -> List[MetricScore]:
@@ -292,88 +465,183 @@ class DeepEvalEvaluator:
         base_score = 0.85 if proceed else 0.35
         confidence = 0.9 if proceed else 0.8
         
-        metric_scores = []
-        expected_metrics = ["relevance", "accuracy", "completeness", "clarity", "structure", "consistency", "hallucination_detection", "context_adherence", "factual_grounding"]
+        # Add some variation to scores to make them more realistic
+        variations = [_rng.uniform(-0.05, 0.05) for _ in EXPECTED_METRICS]
+        final_scores = [
+            round(min(max(base_score + score_variation, 0.0), 1.0), 2)
+            for score_variation in variations
+        ]
         
-        for metric_name in expected_metrics:
-            # Add some variation to scores to make them more realistic
-            import random
-            score_variation = random.uniform(-0.05, 0.05)
-            final_score = round(min(max(base_score + score_variation, 0.0), 1.0), 2)
-            
-            if final_score < 0.65:
-                # Include reasoning for low scores
-                metric_scores.append(MetricScore(
-                    metric=metric_name,
-                    score=final_score,
-                    reasoning=reason,
-                    confidence=confidence
-                ))
-            else:
-                # Exclude reasoning for high scores
-                metric_scores.append(MetricScore(
-                    metric=metric_name,
-                    score=final_score,
-                    reasoning=None,
-                    confidence=confidence
-                ))
-        
-        return metric_scores
+        # Include reasoning only for low scores
+        return [
+            MetricScore.model_construct(
+                metric=metric_name,
+                score=final_score,
+                reasoning=reason if final_score < 0.65 else None,
+                confidence=confidence
+            )
+            for metric_name, final_score in zip(EXPECTED_METRICS, final_scores)
+        ]
     
     def _get_default_metric_scores(self, error_message: str) -> List[MetricScore]:
         """Return default metric scores in case of errors"""
-        default_metrics = ["relevance", "accuracy", "completeness", "clarity", "structure", "consistency", "hallucination_detection", "context_adherence", "factual_grounding"]
+        # Values are fixed and in range, so validation is skipped
         return [
-            MetricScore(
+            MetricScore.model_construct(
                 metric=metric,
                 score=0.5,
                 reasoning=error_message,  # Always show reasoning for error cases since score is 0.5 (< 0.65)
                 confidence=0.1
             )
-            for metric in default_metrics
+            for metric in EXPECTED_METRICS
         ]
     
-    async def evaluate_all(self, evaluation_input: EvaluationInput) -> EvaluationResult:
-        """Evaluate all metrics and return complete result"""
+    async def evaluate_all(self, evaluation_input: EvaluationInput, now_iso: Optional[str] = None) -> EvaluationResult:
+        """Evaluate all metrics and return complete result, timestamped now_iso (default: now)"""
         
         # Use the new method that handles the system_prompt
         metric_scores = await self.evaluate_all_metrics(evaluation_input)
         
-        # Calculate overall score (weighted average)
-        overall_score = round(sum(
-            score.score * METRIC_WEIGHTS.get(score.metric, 1.0/len(metric_scores))
-            for score in metric_scores
-        ), 2)
+        return await self._build_result(
+            metric_scores,
+            session_id=evaluation_input.session_id,
+            backlog_type=evaluation_input.backlog_type,
+            title=evaluation_input.generated_content.title,
+            evaluation_metadata={
+                "backlog_type": evaluation_input.backlog_type,
+                "content_length": len(evaluation_input.generated_content.formatted_output),
+                "context_items": len(evaluation_input.context)
+            },
+            evaluation_timestamp=now_iso or datetime.now().isoformat()
+        )
+    
+    async def submit_batch_evaluation(self, evaluation_input: EvaluationInput) -> Optional[str]:
+        """
+        Submit the judge call to the provider Batch API.
         
-        # Generate summary and recommendations using centralized API client
-        summary = await self._generate_summary(metric_scores, evaluation_input)
-        recommendations = await self._generate_recommendations(metric_scores, evaluation_input)
+        Returns:
+            The batch id, or None when the judge response is already cached and the
+            evaluation can run synchronously instead
+        """
+        is_validation = self._is_validation_prompt(evaluation_input.system_prompt)
+        if is_validation:
+            user_message = self._build_validation_message(evaluation_input)
+        else:
+            user_message = self._build_evaluation_message(evaluation_input)
         
-        return EvaluationResult(
-            session_id=evaluation_input.session_id,
+        messages = [
+            {"role": "system", "content": evaluation_input.system_prompt},
+            {"role": "user", "content": user_message}
+        ]
+        if _response_cache is not None and self._response_cache_key(evaluation_input.system_prompt, user_message) in _response_cache:
+            return None
+        if await self.api_client.get_cached_response(messages) is not None:
+            return None
+        
+        # Batch metadata values are limited to 512 characters
+        metadata = {
+            "session_id": evaluation_input.session_id,
+            "backlog_type": evaluation_input.backlog_type,
+            "title": evaluation_input.generated_content.title[:512],
+            "prompt_format": "validation" if is_validation else "evaluation",
+            "content_length": str(len(evaluation_input.generated_content.formatted_output)),
+            "context_items": str(len(evaluation_input.context)),
+            "tokens_used": str(count_tokens(evaluation_input.user_prompt))
+        }
+        return await self.api_client.submit_batch([(evaluation_input.session_id, messages)], metadata)
+    
+    async def collect_batch_evaluation(
+        self, batch_id: str, now_iso: Optional[str] = None
+    ) -> Tuple[str, Dict[str, str], Optional[EvaluationResult]]:
+        """
+        Poll a batch submitted by submit_batch_evaluation; a completed result is timestamped now_iso (default: now).
+        
+        Returns:
+            The provider batch status, the batch metadata and, once the batch has
+            completed, the evaluation result (built once, then served from memory)
+        """
+        finished = _batch_results.get(batch_id)
+        if finished is not None:
+            return finished
+        
+        status, metadata, outputs = await self.api_client.retrieve_batch(batch_id)
+        if status != "completed":
+            return status, metadata, None
+        
+        response_content = outputs.get(metadata.get("session_id"))
+        if response_content is None:
+            metric_scores = self._get_default_metric_scores("No batch output for evaluation request")
+        elif metadata.get("prompt_format") == "validation":
+            validation_result = await self._parse_validation_response(response_content)
+            metric_scores = self._convert_validation_to_metrics(validation_result)
+        else:
+            metric_scores = self._parse_evaluation_response(response_content)
+        
+        result = await self._build_result(
+            metric_scores,
+            session_id=metadata.get("session_id", ""),
+            backlog_type=metadata.get("backlog_type", ""),
+            title=metadata.get("title", ""),
+            evaluation_metadata={
+                "backlog_type": metadata.get("backlog_type", ""),
+                "content_length": int(metadata.get("content_length", 0)),
+                "context_items": int(metadata.get("context_items", 0)),
+                "batch_id": batch_id
+            },
+            evaluation_timestamp=now_iso or datetime.now().isoformat()
+        )
+        _batch_results[batch_id] = (status, metadata, result)
+        return status, metadata, result
+    
+    async def _build_result(
+        self,
+        metric_scores: List[MetricScore],
+        session_id: str,
+        backlog_type: str,
+        title: str,
+        evaluation_metadata: Dict[str, Any],
+        evaluation_timestamp: str
+    ) -> EvaluationResult:
+        """Aggregate metric scores into the overall score, summary and recommendations"""
+        
+        # Calculate overall score (weighted average); every metric_scores list is built in EXPECTED_METRICS order
+        overall_score = compute_overall([score.score for score in metric_scores])
+        
+        # Recommendations are only generated for low-scoring metrics; skip the LLM call when there are none
+        low_scores = [score for score in metric_scores if score.score < 0.7]
+        
+        if low_scores:
+            # Generate summary and recommendations concurrently using centralized API client
+            summary, recommendations = await asyncio.gather(
+                self._generate_summary(metric_scores, backlog_type, title),
+                self._generate_recommendations(low_scores, backlog_type)
+            )
+        else:
+            summary = await self._generate_summary(metric_scores, backlog_type, title)
+            recommendations = "Content quality is good. Consider minor refinements based on specific project requirements."
+        
+        # Every field is produced here from already-validated scores, so validation is skipped
+        return EvaluationResult.model_construct(
+            session_id=session_id,
             overall_score=overall_score,
             metric_scores=metric_scores,
             summary=summary,
             recommendations=recommendations,
-            evaluation_timestamp=datetime.now().isoformat(),
-            evaluation_metadata={
-                "backlog_type": evaluation_input.backlog_type,
-                "content_length": len(evaluation_input.generated_content.formatted_output),
-                "context_items": len(evaluation_input.context)
-            }
+            evaluation_timestamp=evaluation_timestamp,
+            evaluation_metadata=evaluation_metadata
         )
     
-    async def _generate_summary(self, metric_scores: List[MetricScore], evaluation_input: EvaluationInput) -> str:
+    async def _generate_summary(self, metric_scores: List[MetricScore], backlog_type: str, title: str) -> str:
         """Generate evaluation summary using centralized API client"""
         try:
             scores_text = "\n".join([f"- {score.metric}: {score.score:.2f}" + (f" - {score.reasoning}" if score.reasoning else "") for score in metric_scores])
             
             prompt = f"""
-            Based on the following evaluation scores for a {evaluation_input.backlog_type}, provide a concise summary:
+            Based on the following evaluation scores for a {backlog_type}, provide a concise summary:
             
             {scores_text}
             
-            Generated Content Title: {evaluation_input.generated_content.title}
+            Generated Content Title: {title}
             
             Provide a 2-3 sentence summary of the overall quality and key strengths/weaknesses.
             """
@@ -381,21 +649,16 @@ class DeepEvalEvaluator:
             return await self.api_client.call_for_summary(prompt)
             
         except Exception as e:
-            logger.error(f"Error generating summary: {str(e)}")
+            logger.error("Error generating summary: %s", e)
             return "Evaluation completed with mixed results. Review individual metric scores for details."
     
-    async def _generate_recommendations(self, metric_scores: List[MetricScore], evaluation_input: EvaluationInput) -> str:
-        """Generate improvement recommendations using centralized API client"""
+    async def _generate_recommendations(self, low_scores: List[MetricScore], backlog_type: str) -> str:
+        """Generate improvement recommendations for the low-scoring metrics using centralized API client"""
         try:
-            low_scores = [score for score in metric_scores if score.score < 0.7]
-            
-            if not low_scores:
-                return "Content quality is good. Consider minor refinements based on specific project requirements."
-            
             recommendations_text = "\n".join([f"- {score.metric} (Score: {score.score:.2f})" + (f": {score.reasoning}" if score.reasoning else "") for score in low_scores])
             
             prompt = f"""
-            Based on these low-scoring evaluation metrics for a {evaluation_input.backlog_type}, provide 3-5 specific, actionable recommendations for improvement:
+            Based on these low-scoring evaluation metrics for a {backlog_type}, provide 3-5 specific, actionable recommendations for improvement:
             
             {recommendations_text}
             
@@ -409,5 +672,5 @@ class DeepEvalEvaluator:
             return "\n".join(recommendations[:5])  # Limit to 5 recommendations and join as single string
             
         except Exception as e:
-            logger.error(f"Error generating recommendations: {str(e)}")
+            logger.error("Error generating recommendations: %s", e)
             return "Review content for accuracy and completeness. Improve clarity and structure. Ensure alignment with requirements."
@@ -1,11 +1,17 @@
 """
 Evaluation prompts for different metrics used by the Response Evaluator Agent.
 """
+import re
+import sys
+from types import MappingProxyType
+from typing import Mapping
+
 from src.api.backlog_evaluator_contracts import EvaluationMetric
 
 
-EVALUATION_PROMPTS = {
-    EvaluationMetric.RELEVANCE: """
+# Keyed by the metric value (a plain str), not the enum member; read-only, shared by all requests
+EVALUATION_PROMPTS: Mapping[str, str] = MappingProxyType({
+    EvaluationMetric.RELEVANCE.value: """
     Evaluate how well the generated content addresses the user's prompt and follows the provided template.
     
     User Prompt: {user_prompt}
@@ -30,7 +36,7 @@ EVALUATION_PROMPTS = {
     }}
     """,
     
-    EvaluationMetric.ACCURACY: """
+    EvaluationMetric.ACCURACY.value: """
     Evaluate the factual accuracy and technical correctness of the generated content.
     
     Generated Content: {content}
@@ -53,7 +59,7 @@ EVALUATION_PROMPTS = {
     }}
     """,
     
-    EvaluationMetric.COMPLETENESS: """
+    EvaluationMetric.COMPLETENESS.value: """
     Evaluate how complete the generated content is for the requested backlog type and template requirements.
     
     User Prompt: {user_prompt}
@@ -78,7 +84,7 @@ EVALUATION_PROMPTS = {
     }}
     """,
     
-    EvaluationMetric.CLARITY: """
+    EvaluationMetric.CLARITY.value: """
     Evaluate the clarity and readability of the generated content.
     
     Generated Content: {content}
@@ -99,7 +105,7 @@ EVALUATION_PROMPTS = {
     }}
     """,
     
-    EvaluationMetric.STRUCTURE: """
+    EvaluationMetric.STRUCTURE.value: """
     Evaluate the structure and format of the generated content against template requirements.
     
     Template Instructions: {template}
@@ -123,7 +129,7 @@ EVALUATION_PROMPTS = {
     }}
     """,
     
-    EvaluationMetric.CONSISTENCY: """
+    EvaluationMetric.CONSISTENCY.value: """
     Evaluate the consistency within the generated content and with the context.
     
     Generated Content: {content}
@@ -146,7 +152,7 @@ EVALUATION_PROMPTS = {
     }}
     """,
     
-    EvaluationMetric.HALLUCINATION_DETECTION: """
+    EvaluationMetric.HALLUCINATION_DETECTION.value: """
     Evaluate whether the generated content contains hallucinated information that is not supported by the provided context.
     
     Generated Content: {content}
@@ -169,7 +175,7 @@ EVALUATION_PROMPTS = {
     }}
     """,
     
-    EvaluationMetric.CONTEXT_ADHERENCE: """
+    EvaluationMetric.CONTEXT_ADHERENCE.value: """
     Evaluate how well the generated content adheres to and stays grounded in the provided context.
     
     Generated Content: {content}
@@ -192,7 +198,7 @@ EVALUATION_PROMPTS = {
     }}
     """,
     
-    EvaluationMetric.FACTUAL_GROUNDING: """
+    EvaluationMetric.FACTUAL_GROUNDING.value: """
     Evaluate the factual grounding and verifiability of claims made in the generated content.
     
     Generated Content: {content}
@@ -214,38 +220,52 @@ EVALUATION_PROMPTS = {
         "confidence": <float>
     }}
     """
-}
+})
 
 
 # System prompts for different API calls
-SYSTEM_PROMPTS = {
+SYSTEM_PROMPTS: Mapping[str, str] = MappingProxyType({
     "evaluation": "You are an expert evaluator of software development artifacts. Provide precise, objective evaluations.",
     "summary": "You are an expert at summarizing evaluation results.",
     "recommendations": "You are an expert at providing actionable improvement recommendations."
+})
+
+
+# Lines that only label an input placeholder, e.g. "Generated Content: {content}"
+_PLACEHOLDER_LINE = re.compile(r'^\s*[\w ]+: \{\w+\}\s*$', re.MULTILINE)
+
+# Focus named in the lead-in of the metrics that need a specialist evaluator
+_SPECIALIZATIONS = {
+    EvaluationMetric.HALLUCINATION_DETECTION.value: "hallucination detection",
+    EvaluationMetric.CONTEXT_ADHERENCE.value: "context adherence",
+    EvaluationMetric.FACTUAL_GROUNDING.value: "factual grounding assessment",
 }
 
 
-# System prompts for POST request JSON schema
-REQUEST_SYSTEM_PROMPTS = {
-    "relevance": "You are an expert evaluator of software development artifacts. Provide precise, objective evaluations. Evaluate how well the generated content addresses the user's prompt and follows the provided template. Consider: Does the generated content directly address what the user asked for? Is the title appropriate for the content? Does it match the requested backlog type? Does it follow the format and structure specified in the template? Rate from 0.0 to 1.0 and explain your reasoning in 1-2 sentences maximum. Respond in JSON format: {\"score\": <float>, \"reasoning\": \"<brief 1-2 sentence explanation>\", \"confidence\": <float>}",
-    
-    "accuracy": "You are an expert evaluator of software development artifacts. Provide precise, objective evaluations. Evaluate the factual accuracy and technical correctness of the generated content. Consider: Are the technical details correct? Are the acceptance criteria realistic and testable? Are the non-functional requirements properly specified? Is the content consistent with the provided context? Rate from 0.0 to 1.0 and explain your reasoning in 1-2 sentences maximum. Respond in JSON format: {\"score\": <float>, \"reasoning\": \"<brief 1-2 sentence explanation>\", \"confidence\": <float>}",
-    
-    "completeness": "You are an expert evaluator of software development artifacts. Provide precise, objective evaluations. Evaluate how complete the generated content is for the requested backlog type and template requirements. Consider: Does it include all necessary sections for the specified backlog type? Does it include all sections and elements specified in the template? Are acceptance criteria comprehensive? Are non-functional requirements included where appropriate? Is anything important missing from the template requirements? Rate from 0.0 to 1.0 and explain your reasoning in 1-2 sentences maximum. Respond in JSON format: {\"score\": <float>, \"reasoning\": \"<brief 1-2 sentence explanation>\", \"confidence\": <float>}",
-    
-    "clarity": "You are an expert evaluator of software development artifacts. Provide precise, objective evaluations. Evaluate the clarity and readability of the generated content. Consider: Is the language clear and professional? Are the requirements easy to understand? Is the structure logical and well-organized? Would stakeholders easily understand this content? Rate from 0.0 to 1.0 and explain your reasoning in 1-2 sentences maximum. Respond in JSON format: {\"score\": <float>, \"reasoning\": \"<brief 1-2 sentence explanation>\", \"confidence\": <float>}",
-    
-    "structure": "You are an expert evaluator of software development artifacts. Provide precise, objective evaluations. Evaluate the structure and format of the generated content against template requirements. Consider: Is the markdown formatting correct and consistent? Are sections properly organized according to the template? Does it follow the structure specified in the template? Does it follow standard format conventions for the specified backlog type? Is the hierarchy clear (headers, subheaders, etc.)? Rate from 0.0 to 1.0 and explain your reasoning in 1-2 sentences maximum. Respond in JSON format: {\"score\": <float>, \"reasoning\": \"<brief 1-2 sentence explanation>\", \"confidence\": <float>}",
-    
-    "consistency": "You are an expert evaluator of software development artifacts. Provide precise, objective evaluations. Evaluate the consistency within the generated content and with the context. Consider: Is the content internally consistent? Does it align with the provided context? Are there any contradictions or inconsistencies? Is the tone and style consistent throughout? Rate from 0.0 to 1.0 and explain your reasoning in 1-2 sentences maximum. Respond in JSON format: {\"score\": <float>, \"reasoning\": \"<brief 1-2 sentence explanation>\", \"confidence\": <float>}",
-    
-    "hallucination_detection": "You are an expert evaluator of software development artifacts specializing in hallucination detection. Provide precise, objective evaluations. Evaluate whether the generated content contains hallucinated information not supported by the provided context. Consider: Does the content make claims not supported by the context? Are there fabricated technical details, requirements, or specifications? Does the content introduce information not present in the source context? Are all factual statements verifiable against the provided context? Rate from 0.0 (high hallucination) to 1.0 (no hallucination). Respond in JSON format: {\"score\": <float>, \"reasoning\": \"<brief 1-2 sentence explanation>\", \"confidence\": <float>}",
-    
-    "context_adherence": "You are an expert evaluator of software development artifacts specializing in context adherence. Provide precise, objective evaluations. Evaluate how well the generated content adheres to and stays grounded in the provided context. Consider: Does the content strictly follow information from the context? Are all requirements and specifications derived from the context? Does it avoid introducing external assumptions or knowledge? How well does it maintain fidelity to the source material? Rate from 0.0 to 1.0 and explain your reasoning in 1-2 sentences maximum. Respond in JSON format: {\"score\": <float>, \"reasoning\": \"<brief 1-2 sentence explanation>\", \"confidence\": <float>}",
-    
-    "factual_grounding": "You are an expert evaluator of software development artifacts specializing in factual grounding assessment. Provide precise, objective evaluations. Evaluate the factual grounding and verifiability of claims made in the generated content. Consider: Are technical specifications and requirements factually grounded? Can all claims be traced back to the provided context? Are acceptance criteria realistic and implementable? Does the content avoid speculative or unverifiable statements? Rate from 0.0 to 1.0 and explain your reasoning in 1-2 sentences maximum. Respond in JSON format: {\"score\": <float>, \"reasoning\": \"<brief 1-2 sentence explanation>\", \"confidence\": <float>}",
-    
+def _flatten_prompt(template: str, prefix: str) -> str:
+    """Turn an EVALUATION_PROMPTS template into a single-line system prompt without placeholders"""
+    text = _PLACEHOLDER_LINE.sub("", template)
+    text = re.sub(r'\s*\(\{\w+\}\)', "", text)
+    text = text.replace("a {backlog_type}", "the specified backlog type")
+    text = re.sub(r'\{(\w+)\}', lambda m: m.group(1).replace("_", " "), text)
+    text = text.replace("{{", "{").replace("}}", "}")
+    lines = (line.strip().removeprefix("- ") for line in text.splitlines())
+    flat = " ".join(line for line in lines if line)
+    return sys.intern(f"{prefix} {flat}".replace("{ ", "{").replace(" }", "}"))
+
+
+def _lead_in(metric: str) -> str:
+    """SYSTEM_PROMPTS["evaluation"], naming the evaluator's specialization if the metric has one"""
+    specialization = _SPECIALIZATIONS.get(metric)
+    if specialization is None:
+        return SYSTEM_PROMPTS["evaluation"]
+    return SYSTEM_PROMPTS["evaluation"].replace(" artifacts.", f" artifacts specializing in {specialization}.", 1)
+
+
+# System prompts for POST request JSON schema, generated from EVALUATION_PROMPTS so
+# each metric's instructions have a single source of truth
+REQUEST_SYSTEM_PROMPTS: Mapping[str, str] = MappingProxyType({
+    **{metric: _flatten_prompt(template, _lead_in(metric)) for metric, template in EVALUATION_PROMPTS.items()},
     "summary": "You are an expert at summarizing evaluation results. Provide a comprehensive summary of the evaluation metrics and overall assessment of the generated content quality.",
-    
     "recommendations": "You are an expert at providing actionable improvement recommendations. Analyze the evaluation results and provide specific, actionable suggestions for improving the generated content."
-}
+})
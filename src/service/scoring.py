@@ -0,0 +1,31 @@
+"""
+Weighted aggregation of metric scores into the overall evaluation score.
+"""
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from src.config.config import METRIC_WEIGHTS, logger
+
+# Metrics the judge is asked to score, in reporting order
+EXPECTED_METRICS: Tuple[str, ...] = (
+    "relevance", "accuracy", "completeness", "clarity", "structure", "consistency",
+    "hallucination_detection", "context_adherence", "factual_grounding"
+)
+
+# Weight for a metric missing from METRIC_WEIGHTS
+_DEFAULT_WEIGHT = 1.0 / len(EXPECTED_METRICS)
+
+# Configured weight names are checked once here rather than on every request
+for _metric in METRIC_WEIGHTS.keys() - set(EXPECTED_METRICS):
+    logger.warning("Ignoring weight for unknown metric: %s", _metric)
+for _metric in set(EXPECTED_METRICS) - METRIC_WEIGHTS.keys():
+    logger.warning("No weight configured for metric %s, using %.3f", _metric, _DEFAULT_WEIGHT)
+
+# Metric weights aligned with EXPECTED_METRICS, for the vectorized overall score
+_WEIGHT_VEC = np.array([METRIC_WEIGHTS.get(metric, _DEFAULT_WEIGHT) for metric in EXPECTED_METRICS])
+
+
+def compute_overall(scores: Sequence[float]) -> float:
+    """Weighted overall score of one evaluation's scores, given in EXPECTED_METRICS order"""
+    return round(float(np.dot(_WEIGHT_VEC, scores)), 2)
@@ -0,0 +1,61 @@
+"""
+Token counting helpers shared by the API and client layers.
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+import tiktoken
+
+from src.config.config import PORTKEY_MODEL, logger
+
+# Seconds to wait before retrying an encoding that failed to load
+_RETRY_INTERVAL = 60.0
+
+# Loaded encodings per model; failures are not cached, only delayed via _retry_after
+_encodings: Dict[str, tiktoken.Encoding] = {}
+_retry_after: Dict[str, float] = {}
+
+
+def get_encoding(model: str = PORTKEY_MODEL) -> Optional[tiktoken.Encoding]:
+    """
+    Return the BPE encoding for a model, loading it on first use, or None if it cannot be loaded.
+
+    Loading may download the BPE file, so this blocks; call it from a thread (see
+    warm_encoding) rather than the event loop.
+    """
+    encoding = _encodings.get(model)
+    if encoding is not None:
+        return encoding
+    try:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            logger.warning("No tiktoken encoding registered for model %s, using cl100k_base", model)
+            encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # BPE files are downloaded on first use, which fails on hosts without network access
+        logger.warning("Could not load tiktoken encoding for model %s, estimating tokens from whitespace: %s", model, e)
+        _retry_after[model] = time.monotonic() + _RETRY_INTERVAL
+        return None
+    _encodings[model] = encoding
+    return encoding
+
+
+async def warm_encoding(model: str = PORTKEY_MODEL) -> None:
+    """Load the encoding in a worker thread so the first request does not block the event loop"""
+    await asyncio.to_thread(get_encoding, model)
+
+
+def count_tokens(text: str, model: str = PORTKEY_MODEL) -> int:
+    """Count the tokens in a piece of text for the given model"""
+    encoding = _encodings.get(model)
+    if encoding is None:
+        if time.monotonic() >= _retry_after.get(model, 0.0):
+            # Load in the background instead of blocking the caller; claim the retry slot first
+            _retry_after[model] = time.monotonic() + _RETRY_INTERVAL
+            threading.Thread(target=get_encoding, args=(model,), daemon=True).start()
+        # Roughly two tokens per word, counted without splitting the text into a list
+        return (text.count(" ") + 1) * 2 if text else 0
+    return len(encoding.encode_ordinary(text))
@@ -0,0 +1,133 @@
+"""
+Tests for submitting evaluations through the provider Batch API and polling them.
+"""
+import json
+
+import pytest
+
+from src.api.backlog_evaluator_contracts import EvaluationInput, EvaluationMetric
+from src.service import evaluators
+from src.service.evaluators import DeepEvalEvaluator
+
+
+JUDGE_RESPONSE = json.dumps({
+    metric.value: {"score": 0.9, "reasoning": "Good", "confidence": 0.9} for metric in EvaluationMetric
+})
+
+
+class FakeBatchClient:
+    """Stands in for PortkeyAPIClient, recording the batch and generation calls"""
+    
+    def __init__(self, status="completed", cached_response=None):
+        self.status = status
+        self.cached_response = cached_response
+        self.submitted = []
+        self.retrievals = 0
+        self.summaries = 0
+        self.recommendations = 0
+    
+    async def get_cached_response(self, messages):
+        return self.cached_response
+    
+    async def submit_batch(self, requests, metadata):
+        self.submitted.append((requests, metadata))
+        return "batch_123"
+    
+    async def retrieve_batch(self, batch_id):
+        self.retrievals += 1
+        requests, metadata = self.submitted[-1]
+        outputs = {}
+        if self.status == "completed":
+            outputs = {custom_id: JUDGE_RESPONSE for custom_id, _ in requests}
+        return self.status, metadata, outputs
+    
+    async def call_for_summary(self, prompt):
+        self.summaries += 1
+        return "Summary"
+    
+    async def call_for_recommendations(self, prompt):
+        self.recommendations += 1
+        return "Recommendation"
+
+
+@pytest.fixture
+def evaluation_input():
+    return EvaluationInput(
+        session_id="session-1",
+        user_prompt="Write a user story for login",
+        system_prompt="You are an expert evaluator. Return JSON scores for every metric.",
+        template="As a <user> I want <goal> so that <benefit>",
+        backlog_type="user_story",
+        generated_content={"title": "Login", "formatted_output": "As a user I want to log in."},
+        context=[{"content": "Users authenticate with SSO."}],
+        mode="batch"
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_batch_results():
+    evaluators._batch_results.clear()
+    yield
+    evaluators._batch_results.clear()
+
+
+def make_evaluator(client):
+    evaluator = DeepEvalEvaluator()
+    evaluator.api_client = client
+    return evaluator
+
+
+async def test_submit_sends_the_judge_call_with_its_metadata(evaluation_input):
+    client = FakeBatchClient()
+    
+    batch_id = await make_evaluator(client).submit_batch_evaluation(evaluation_input)
+    
+    assert batch_id == "batch_123"
+    [(requests, metadata)] = client.submitted
+    [(custom_id, messages)] = requests
+    assert custom_id == "session-1"
+    assert messages[0] == {"role": "system", "content": evaluation_input.system_prompt}
+    assert "GENERATED_TITLE: Login" in messages[1]["content"]
+    assert metadata["session_id"] == "session-1"
+    assert metadata["prompt_format"] == "evaluation"
+    assert all(isinstance(value, str) for value in metadata.values())
+
+
+async def test_submit_is_skipped_for_a_cached_judge_response(evaluation_input):
+    client = FakeBatchClient(cached_response=JUDGE_RESPONSE)
+    
+    assert await make_evaluator(client).submit_batch_evaluation(evaluation_input) is None
+    assert client.submitted == []
+
+
+async def test_pending_batch_has_no_result(evaluation_input):
+    client = FakeBatchClient(status="in_progress")
+    evaluator = make_evaluator(client)
+    batch_id = await evaluator.submit_batch_evaluation(evaluation_input)
+    
+    status, metadata, result = await evaluator.collect_batch_evaluation(batch_id)
+    
+    assert status == "in_progress"
+    assert metadata["session_id"] == "session-1"
+    assert result is None
+    assert client.summaries == 0
+
+
+async def test_completed_batch_is_built_once_and_served_on_repoll(evaluation_input):
+    client = FakeBatchClient()
+    evaluator = make_evaluator(client)
+    batch_id = await evaluator.submit_batch_evaluation(evaluation_input)
+    
+    status, _, result = await evaluator.collect_batch_evaluation(batch_id)
+    
+    assert status == "completed"
+    assert result.session_id == "session-1"
+    assert [score.metric for score in result.metric_scores] == list(EvaluationMetric)
+    assert result.overall_score == pytest.approx(0.9)
+    assert result.evaluation_metadata["batch_id"] == batch_id
+    assert (client.retrievals, client.summaries, client.recommendations) == (1, 1, 0)
+    
+    repoll = await evaluator.collect_batch_evaluation(batch_id)
+    
+    assert repoll[2] is result
+    assert (client.retrievals, client.summaries, client.recommendations) == (1, 1, 0)
@@ -0,0 +1,36 @@
+"""
+Tests for extracting the judge's JSON object from an LLM response.
+"""
+import orjson
+import pytest
+
+from src.service.evaluators import _extract_json
+
+
+def test_plain_json_is_parsed_directly():
+    assert _extract_json('{"relevance": {"score": 0.9}}') == {"relevance": {"score": 0.9}}
+
+
+@pytest.mark.parametrize("text", [
+    'Here is the evaluation:\n{"relevance": {"score": 0.9}}\nLet me know if you need more.',
+    '```json\n{"relevance": {"score": 0.9}}\n```',
+])
+def test_json_wrapped_in_text_is_extracted(text):
+    assert _extract_json(text) == {"relevance": {"score": 0.9}}
+
+
+def test_envelope_spans_nested_objects():
+    text = 'Result: {"relevance": {"score": 0.9, "reasoning": "ok"}, "clarity": {"score": 0.8}} done'
+    assert _extract_json(text) == {
+        "relevance": {"score": 0.9, "reasoning": "ok"},
+        "clarity": {"score": 0.8}
+    }
+
+
+def test_response_without_braces_returns_none():
+    assert _extract_json("I cannot evaluate this content.") is None
+
+
+def test_invalid_json_in_braces_raises():
+    with pytest.raises(orjson.JSONDecodeError):
+        _extract_json("Result: {relevance: 0.9}")
@@ -0,0 +1,84 @@
+"""
+Tests for finding the first JSON object in a streamed judge response.
+"""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.service.clients import JSONObjectScanner, PortkeyAPIClient
+
+
+OBJECT = '{"relevance": {"score": 0.9, "reasoning": "Uses {braces} and \\"quotes\\" \\\\"}, "clarity": {"score": 0.8}}'
+
+
+def feed_all(chunks):
+    scanner = JSONObjectScanner()
+    for chunk in chunks:
+        result = scanner.feed(chunk)
+        if result is not None:
+            return result
+    return None
+
+
+def test_sample_object_is_valid_json():
+    assert json.loads(OBJECT)["relevance"]["reasoning"] == 'Uses {braces} and "quotes" \\'
+
+
+def test_object_in_one_chunk_skips_surrounding_text():
+    assert feed_all(["Sure, here it is: " + OBJECT + " Hope this helps {"]) == OBJECT
+
+
+@pytest.mark.parametrize("split", range(1, len(OBJECT)))
+def test_object_split_at_any_chunk_boundary(split):
+    assert feed_all(["Preamble ", OBJECT[:split], OBJECT[split:], " trailing"]) == OBJECT
+
+
+def test_object_streamed_one_character_at_a_time():
+    assert feed_all(list("text " + OBJECT + " more")) == OBJECT
+
+
+def test_incomplete_object_returns_none_and_keeps_the_text():
+    scanner = JSONObjectScanner()
+    assert scanner.feed("Intro ") is None
+    assert scanner.feed(OBJECT[:-1]) is None
+    assert scanner.text == "Intro " + OBJECT[:-1]
+
+
+def test_only_the_first_object_is_returned():
+    assert feed_all(['{"a": 1} {"b": 2}']) == '{"a": 1}'
+
+
+def stream(deltas):
+    """Fake streamed completion: yields chunks carrying the given deltas and records closing"""
+    class Stream:
+        closed = False
+        received = 0
+        
+        def __aiter__(self):
+            return self._chunks()
+        
+        async def _chunks(self):
+            for delta in deltas:
+                self.received += 1
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+        
+        async def aclose(self):
+            self.closed = True
+    
+    return Stream()
+
+
+async def test_read_stream_stops_at_the_closing_brace():
+    chunks = stream(["Result: ", OBJECT[:20], OBJECT[20:], " trailing", " text"])
+    
+    assert await PortkeyAPIClient._read_stream(chunks) == OBJECT
+    assert chunks.received == 3
+    assert chunks.closed
+
+
+async def test_read_stream_returns_all_text_without_an_object():
+    chunks = stream(["no ", None, "json ", "here"])
+    
+    assert await PortkeyAPIClient._read_stream(chunks) == "no json here"
+    assert chunks.closed
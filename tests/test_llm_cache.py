@@ -0,0 +1,168 @@
+"""
+Tests for the LLM response cache and its storage backends.
+"""
+import time
+
+import numpy as np
+import pytest
+
+from src.service.clients import FileCacheBackend, LLMCache, MemoryCacheBackend, SemanticCache
+
+
+MESSAGES = [
+    {"role": "system", "content": "You are an evaluator."},
+    {"role": "user", "content": "Evaluate this."}
+]
+
+
+def make_key(**overrides):
+    params = {
+        "model": "gpt-4o-mini",
+        "provider": "@azure-openai",
+        "temperature": 0.0,
+        "max_tokens": 100,
+        "messages": MESSAGES
+    }
+    params.update(overrides)
+    return LLMCache.make_key(**params)
+
+
+def test_make_key_is_deterministic():
+    assert make_key() == make_key(messages=[dict(message) for message in MESSAGES])
+    assert len(make_key()) == 64
+
+
+@pytest.mark.parametrize("override", [
+    {"model": "gpt-4o"},
+    {"provider": "@openai"},
+    {"temperature": 0.6},
+    {"max_tokens": 200},
+    {"messages": MESSAGES[:1]},
+])
+def test_make_key_depends_on_every_request_parameter(override):
+    assert make_key(**override) != make_key()
+
+
+@pytest.mark.parametrize("policy, temperature, expected", [
+    ("enabled", 0.0, True),
+    ("enabled", 0.6, False),
+    ("enabled_all", 0.6, True),
+    ("read_only", 0.0, True),
+    ("read_only", 0.6, False),
+    ("replay", 0.6, True),
+    ("disabled", 0.0, False),
+])
+def test_applies_to(policy, temperature, expected):
+    assert LLMCache(MemoryCacheBackend(), policy=policy).applies_to(temperature) is expected
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        LLMCache(MemoryCacheBackend(), policy="sometimes")
+
+
+async def test_get_and_set_count_hits_and_misses():
+    cache = LLMCache(MemoryCacheBackend())
+    key = make_key()
+    
+    assert await cache.get(key) is None
+    await cache.set(key, "cached response")
+    assert await cache.get(key) == "cached response"
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.parametrize("policy", ["read_only", "replay"])
+async def test_read_only_policies_never_write(policy):
+    backend = MemoryCacheBackend()
+    cache = LLMCache(backend, policy=policy)
+    
+    await cache.set(make_key(), "cached response")
+    assert await backend.get(make_key()) is None
+
+
+async def test_backend_errors_are_treated_as_misses():
+    class FailingBackend:
+        async def get(self, key):
+            raise ConnectionError("backend down")
+        
+        async def set(self, key, value, ttl):
+            raise ConnectionError("backend down")
+    
+    cache = LLMCache(FailingBackend())
+    await cache.set(make_key(), "cached response")
+    assert await cache.get(make_key()) is None
+    assert cache.stats == {"hits": 0, "misses": 1}
+
+
+async def test_memory_backend_expires_entries(monkeypatch):
+    backend = MemoryCacheBackend()
+    await backend.set("key", {"content": "value"}, ttl=10)
+    assert await backend.get("key") == {"content": "value"}
+    
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert await backend.get("key") is None
+
+
+async def test_memory_backend_keeps_entries_without_ttl(monkeypatch):
+    backend = MemoryCacheBackend()
+    await backend.set("key", {"content": "value"}, ttl=0)
+    
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 10 ** 6)
+    assert await backend.get("key") == {"content": "value"}
+
+
+async def test_file_backend_round_trip(tmp_path):
+    backend = FileCacheBackend(str(tmp_path))
+    key = make_key()
+    
+    assert await backend.get(key) is None
+    await backend.set(key, {"content": "value"}, ttl=60)
+    assert await backend.get(key) == {"content": "value"}
+    assert (tmp_path / key[:2] / f"{key}.json").exists()
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+async def test_file_backend_removes_expired_entries(tmp_path, monkeypatch):
+    backend = FileCacheBackend(str(tmp_path))
+    key = make_key()
+    await backend.set(key, {"content": "value"}, ttl=10)
+    
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert await backend.get(key) is None
+    assert not (tmp_path / key[:2] / f"{key}.json").exists()
+
+
+def unit(*components):
+    vector = np.array(components, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def test_semantic_cache_returns_most_similar_response_above_threshold():
+    cache = SemanticCache("unused-model", threshold=0.95, max_entries=10)
+    cache.set("partition", unit(1, 0, 0), "first")
+    cache.set("partition", unit(0, 1, 0), "second")
+    
+    assert cache.get("partition", unit(0.1, 1, 0)) == "second"
+    assert cache.get("partition", unit(1, 1, 0)) is None
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+
+def test_semantic_cache_partitions_are_isolated():
+    cache = SemanticCache("unused-model", threshold=0.95, max_entries=10)
+    cache.set("partition", unit(1, 0), "response")
+    
+    assert cache.get("other partition", unit(1, 0)) is None
+
+
+def test_semantic_cache_evicts_oldest_entries():
+    cache = SemanticCache("unused-model", threshold=0.95, max_entries=2)
+    cache.set("partition", unit(1, 0, 0), "first")
+    cache.set("partition", unit(0, 1, 0), "second")
+    cache.set("partition", unit(0, 0, 1), "third")
+    
+    assert cache.get("partition", unit(1, 0, 0)) is None
+    assert cache.get("partition", unit(0, 1, 0)) == "second"
+    assert cache.get("partition", unit(0, 0, 1)) == "third"
@@ -0,0 +1,94 @@
+"""
+Tests for the client-side token-bucket rate limiter.
+"""
+import time
+
+import pytest
+
+from src.service.clients import TokenBucket
+
+
+async def test_disabled_bucket_never_waits():
+    bucket = TokenBucket(rpm=0, tpm=0)
+    
+    assert not bucket.enabled
+    start = time.monotonic()
+    for _ in range(100):
+        await bucket.acquire(estimated_tokens=10 ** 6)
+    assert time.monotonic() - start < 0.1
+
+
+async def test_full_bucket_allows_a_burst_up_to_rpm():
+    bucket = TokenBucket(rpm=60, tpm=0)
+    
+    start = time.monotonic()
+    for _ in range(60):
+        await bucket.acquire(estimated_tokens=0)
+    assert time.monotonic() - start < 0.1
+    assert bucket.request_tokens < 1
+
+
+async def test_empty_bucket_paces_requests_to_rpm():
+    # 1200 RPM refills one request every 50 ms
+    bucket = TokenBucket(rpm=1200, tpm=0)
+    bucket.request_tokens = 0.0
+    
+    start = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire(estimated_tokens=0)
+    assert time.monotonic() - start >= 0.14
+
+
+async def test_empty_bucket_paces_requests_to_tpm():
+    # 6000 TPM refills 100 tokens per second
+    bucket = TokenBucket(rpm=0, tpm=6000)
+    bucket.token_tokens = 0.0
+    
+    start = time.monotonic()
+    await bucket.acquire(estimated_tokens=10)
+    assert time.monotonic() - start >= 0.09
+
+
+async def test_request_larger_than_the_budget_waits_for_a_full_bucket_only():
+    bucket = TokenBucket(rpm=0, tpm=600)
+    
+    start = time.monotonic()
+    await bucket.acquire(estimated_tokens=10 ** 6)
+    assert time.monotonic() - start < 0.1
+    assert bucket.token_tokens == pytest.approx(0.0, abs=1.0)
+
+
+def test_wait_time_covers_the_missing_budget():
+    bucket = TokenBucket(rpm=60, tpm=600)
+    bucket.request_tokens = 0.5
+    bucket.token_tokens = 100.0
+    
+    # Half a request at 1/s, or 200 tokens at 10/s
+    assert bucket._wait_time(300.0) == pytest.approx(20.0)
+    assert bucket._wait_time(50.0) == pytest.approx(0.5)
+
+
+def test_rate_limit_halves_the_rates_and_success_recovers_them():
+    bucket = TokenBucket(rpm=100, tpm=1000)
+    
+    bucket.on_rate_limited()
+    assert bucket.rpm == 50
+    assert bucket.tpm == 500
+    assert bucket.request_tokens <= 0
+    
+    bucket.on_success()
+    assert bucket.rpm == pytest.approx(55)
+    assert bucket.tpm == pytest.approx(550)
+    
+    for _ in range(20):
+        bucket.on_success()
+    assert bucket.rpm == 100
+    assert bucket.tpm == 1000
+
+
+def test_rates_never_drop_below_one():
+    bucket = TokenBucket(rpm=2, tpm=2)
+    for _ in range(5):
+        bucket.on_rate_limited()
+    assert bucket.rpm == 1.0
+    assert bucket.tpm == 1.0